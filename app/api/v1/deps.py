@@ -0,0 +1,39 @@
+"""Shared FastAPI dependencies for the v1 endpoints."""
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.openstack_client import BaseOpenStackClient
+from app.core.security import APIKeyDep
+from app.database import get_session
+from app.services.vm_service import VMService
+
+# Type aliases for dependency injection
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+
+def get_client(request: Request) -> BaseOpenStackClient:
+    """Dependency to get the OpenStack client built in the app lifespan."""
+    return request.app.state.openstack_client
+
+
+OpenStackClientDep = Annotated[BaseOpenStackClient, Depends(get_client)]
+
+
+def get_vm_service(session: SessionDep, client: OpenStackClientDep) -> VMService:
+    """Dependency to get VM service."""
+    return VMService(session=session, openstack_client=client)
+
+
+VMServiceDep = Annotated[VMService, Depends(get_vm_service)]
+
+__all__ = [
+    "APIKeyDep",
+    "OpenStackClientDep",
+    "SessionDep",
+    "VMServiceDep",
+    "get_client",
+    "get_vm_service",
+]
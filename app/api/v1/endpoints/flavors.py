@@ -1,25 +1,28 @@
 """Flavor (VM sizes) endpoints."""
 
-from typing import Annotated
+from collections.abc import Mapping
+from typing import Any
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Path, Request, Response
+from pydantic import TypeAdapter
 
-from app.core.openstack_client import BaseOpenStackClient, get_openstack_client
-from app.core.security import verify_api_key
+from app.api.v1.deps import OpenStackClientDep
+from app.config import get_settings
+from app.core.cache import SingleFlight, TTLCache
+from app.core.etag import etag_response
 from app.schemas.common import FlavorResponse, FlavorListResponse
 
 router = APIRouter()
 
-# Type alias for dependency injection
-APIKeyDep = Annotated[str, Depends(verify_api_key)]
+# Serializers, built once at import
+_FLAVOR_ADAPTER = TypeAdapter(FlavorResponse)
+_FLAVOR_LIST_ADAPTER = TypeAdapter(FlavorListResponse)
 
+# Cached rendered list; the catalog changes far less often than it is read
+_flavor_list_cache: TTLCache[bytes] = TTLCache(ttl=get_settings().catalog_cache_ttl)
 
-def get_client() -> BaseOpenStackClient:
-    """Dependency to get OpenStack client."""
-    return get_openstack_client()
-
-
-OpenStackClientDep = Annotated[BaseOpenStackClient, Depends(get_client)]
+# Concurrent lookups of the same flavor share one OpenStack call
+_flavor_flight: SingleFlight[Mapping[str, Any]] = SingleFlight()
 
 
 @router.get(
@@ -30,17 +33,25 @@ OpenStackClientDep = Annotated[BaseOpenStackClient, Depends(get_client)]
 )
 async def list_flavors(
     client: OpenStackClientDep,
-    api_key: APIKeyDep,
-) -> FlavorListResponse:
+) -> Response:
     """List all available VM flavors.
 
     Flavors define the compute, memory, and storage capacity of VMs.
     """
-    flavors = await client.list_flavors()
-    return FlavorListResponse(
-        items=[FlavorResponse(**f) for f in flavors],
-        total=len(flavors),
-    )
+
+    async def load() -> bytes:
+        flavors = await client.list_flavors()
+        # Validated like the detail endpoint (SDK output carries ISO strings
+        # and optional fields); the rendered bytes are cached, so this runs
+        # once per TTL
+        payload = FlavorListResponse(
+            items=[FlavorResponse.model_validate(f) for f in flavors],
+            total=len(flavors),
+        )
+        return _FLAVOR_LIST_ADAPTER.dump_json(payload)
+
+    content = await _flavor_list_cache.get_or_set("flavors", load)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -50,10 +61,13 @@ async def list_flavors(
     description="Get detailed information about a specific flavor.",
 )
 async def get_flavor(
+    request: Request,
     client: OpenStackClientDep,
-    api_key: APIKeyDep,
     flavor_id: str = Path(..., description="Flavor ID"),
-) -> FlavorResponse:
-    """Get details of a specific flavor by ID."""
-    flavor = await client.get_flavor(flavor_id)
-    return FlavorResponse(**flavor)
+) -> Response:
+    """Get details of a specific flavor by ID.
+
+    Responds with 304 Not Modified when If-None-Match carries the current ETag.
+    """
+    flavor = await _flavor_flight.do(flavor_id, lambda: client.get_flavor(flavor_id))
+    return etag_response(request, _FLAVOR_ADAPTER.dump_json(FlavorResponse(**flavor)))
@@ -1,16 +1,22 @@
 """Health check endpoints."""
 
-from datetime import datetime
+import orjson
+from fastapi import APIRouter, Response
+from pydantic import TypeAdapter
+from sqlalchemy import text
 
-from fastapi import APIRouter
-
-from app.config import get_settings
-from app.core.openstack_client import get_openstack_client
-from app.database import async_session_factory
+from app.api.v1.deps import OpenStackClientDep, SessionDep
+from app.config import SettingsDep
+from app.core.clock import utc_now_coarse
 from app.schemas.common import HealthResponse
 
 router = APIRouter()
 
+# Database probe, built once instead of per health check
+_PING = text("SELECT 1")
+
+_HEALTH_ADAPTER = TypeAdapter(HealthResponse)
+
 
 @router.get(
     "/health",
@@ -18,7 +24,9 @@ router = APIRouter()
     summary="Health check",
     description="Check the health status of the API and its dependencies.",
 )
-async def health_check() -> HealthResponse:
+async def health_check(
+    session: SessionDep, settings: SettingsDep, client: OpenStackClientDep
+) -> Response:
     """Check API health status.
 
     Returns the status of:
@@ -26,48 +34,52 @@ async def health_check() -> HealthResponse:
     - Database connection
     - OpenStack connection
     """
-    settings = get_settings()
     db_status = "connected"
     openstack_status = "mock_mode" if settings.use_mock_openstack else "unknown"
 
     # Check database connection
     try:
-        async with async_session_factory() as session:
-            await session.execute("SELECT 1")
-            db_status = "connected"
+        await session.execute(_PING)
+        db_status = "connected"
     except Exception as e:
         db_status = f"error: {str(e)}"
 
     # Check OpenStack connection
     if not settings.use_mock_openstack:
         try:
-            client = get_openstack_client()
             connected = await client.check_connection()
             openstack_status = "connected" if connected else "disconnected"
         except Exception as e:
             openstack_status = f"error: {str(e)}"
 
-    return HealthResponse(
+    health = HealthResponse(
         status="healthy" if db_status == "connected" else "degraded",
         version=settings.api_version,
-        timestamp=datetime.utcnow(),
+        timestamp=utc_now_coarse(),
         database=db_status,
         openstack=openstack_status,
     )
+    # Probed constantly by load balancers; encode directly to bytes
+    return Response(
+        content=_HEALTH_ADAPTER.dump_json(health), media_type="application/json"
+    )
 
 
 @router.get(
     "/",
+    response_model=dict,
     summary="API root",
     description="Get basic API information.",
 )
-async def root() -> dict:
+async def root(settings: SettingsDep) -> Response:
     """Get API root information."""
-    settings = get_settings()
-    return {
-        "name": settings.api_title,
-        "version": settings.api_version,
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "openapi": "/openapi.json",
-    }
+    content = orjson.dumps(
+        {
+            "name": settings.api_title,
+            "version": settings.api_version,
+            "docs": "/docs",
+            "redoc": "/redoc",
+            "openapi": "/openapi.json",
+        }
+    )
+    return Response(content=content, media_type="application/json")
@@ -1,25 +1,28 @@
 """Image (OS images) endpoints."""
 
-from typing import Annotated
+from collections.abc import Mapping
+from typing import Any
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Path, Request, Response
+from pydantic import TypeAdapter
 
-from app.core.openstack_client import BaseOpenStackClient, get_openstack_client
-from app.core.security import verify_api_key
+from app.api.v1.deps import OpenStackClientDep
+from app.config import get_settings
+from app.core.cache import SingleFlight, TTLCache
+from app.core.etag import etag_response
 from app.schemas.common import ImageResponse, ImageListResponse
 
 router = APIRouter()
 
-# Type alias for dependency injection
-APIKeyDep = Annotated[str, Depends(verify_api_key)]
+# Serializers, built once at import
+_IMAGE_ADAPTER = TypeAdapter(ImageResponse)
+_IMAGE_LIST_ADAPTER = TypeAdapter(ImageListResponse)
 
+# Cached rendered list; the catalog changes far less often than it is read
+_image_list_cache: TTLCache[bytes] = TTLCache(ttl=get_settings().catalog_cache_ttl)
 
-def get_client() -> BaseOpenStackClient:
-    """Dependency to get OpenStack client."""
-    return get_openstack_client()
-
-
-OpenStackClientDep = Annotated[BaseOpenStackClient, Depends(get_client)]
+# Concurrent lookups of the same image share one OpenStack call
+_image_flight: SingleFlight[Mapping[str, Any]] = SingleFlight()
 
 
 @router.get(
@@ -30,17 +33,25 @@ OpenStackClientDep = Annotated[BaseOpenStackClient, Depends(get_client)]
 )
 async def list_images(
     client: OpenStackClientDep,
-    api_key: APIKeyDep,
-) -> ImageListResponse:
+) -> Response:
     """List all available OS images.
 
     Images are operating system templates used to boot VMs.
     """
-    images = await client.list_images()
-    return ImageListResponse(
-        items=[ImageResponse(**img) for img in images],
-        total=len(images),
-    )
+
+    async def load() -> bytes:
+        images = await client.list_images()
+        # Validated like the detail endpoint (SDK output carries ISO strings
+        # and optional fields); the rendered bytes are cached, so this runs
+        # once per TTL
+        payload = ImageListResponse(
+            items=[ImageResponse.model_validate(img) for img in images],
+            total=len(images),
+        )
+        return _IMAGE_LIST_ADAPTER.dump_json(payload)
+
+    content = await _image_list_cache.get_or_set("images", load)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -50,10 +61,13 @@ async def list_images(
     description="Get detailed information about a specific image.",
 )
 async def get_image(
+    request: Request,
     client: OpenStackClientDep,
-    api_key: APIKeyDep,
     image_id: str = Path(..., description="Image ID"),
-) -> ImageResponse:
-    """Get details of a specific image by ID."""
-    image = await client.get_image(image_id)
-    return ImageResponse(**image)
+) -> Response:
+    """Get details of a specific image by ID.
+
+    Responds with 304 Not Modified when If-None-Match carries the current ETag.
+    """
+    image = await _image_flight.do(image_id, lambda: client.get_image(image_id))
+    return etag_response(request, _IMAGE_ADAPTER.dump_json(ImageResponse(**image)))
@@ -1,12 +1,12 @@
 """VM lifecycle management endpoints."""
 
-from typing import Annotated, Optional
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Path, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Path, Query, Request, Response, status
+from pydantic import TypeAdapter
 
-from app.core.security import verify_api_key
-from app.database import get_session
+from app.api.v1.deps import VMServiceDep
+from app.core.etag import etag_response
 from app.models.vm import VMState
 from app.schemas.vm import (
     VMCreate,
@@ -14,25 +14,36 @@ from app.schemas.vm import (
     VMResponse,
     VMListResponse,
     VMActionResponse,
+    VMBulkActionRequest,
+    VMBulkActionResponse,
+    VMBulkSyncRequest,
     VMRebootRequest,
     PaginationParams,
     RebootType,
 )
-from app.services.vm_service import VMService
 
 router = APIRouter()
 
-# Type aliases for dependency injection
-SessionDep = Annotated[AsyncSession, Depends(get_session)]
-APIKeyDep = Annotated[str, Depends(verify_api_key)]
+# Serializers, built once at import
+_VM_ADAPTER = TypeAdapter(VMResponse)
+_VM_LIST_ADAPTER = TypeAdapter(VMListResponse)
+_ACTION_ADAPTER = TypeAdapter(VMActionResponse)
+_BULK_ACTION_ADAPTER = TypeAdapter(VMBulkActionResponse)
 
 
-def get_vm_service(session: SessionDep) -> VMService:
-    """Dependency to get VM service."""
-    return VMService(session=session)
+def _json_response(
+    adapter: TypeAdapter, payload: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Encode a response payload straight to JSON bytes.
 
-
-VMServiceDep = Annotated[VMService, Depends(get_vm_service)]
+    Skips FastAPI's response_model re-validation and jsonable_encoder pass;
+    the payload is already the declared response type.
+    """
+    return Response(
+        content=adapter.dump_json(payload),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -45,8 +56,7 @@ VMServiceDep = Annotated[VMService, Depends(get_vm_service)]
 async def create_vm(
     vm_data: VMCreate,
     service: VMServiceDep,
-    api_key: APIKeyDep,
-) -> VMResponse:
+) -> Response:
     """Create a new virtual machine.
 
     - **name**: VM name (required)
@@ -57,7 +67,8 @@ async def create_vm(
     - **network_id**: Network to attach
     - **security_groups**: List of security groups
     """
-    return await service.create_vm(vm_data)
+    vm = await service.create_vm(vm_data)
+    return _json_response(_VM_ADAPTER, vm, status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -68,12 +79,11 @@ async def create_vm(
 )
 async def list_vms(
     service: VMServiceDep,
-    api_key: APIKeyDep,
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
     state: Optional[VMState] = Query(default=None, description="Filter by state"),
     name: Optional[str] = Query(default=None, description="Filter by name (contains)"),
-) -> VMListResponse:
+) -> Response:
     """List all virtual machines with pagination and optional filtering.
 
     - **page**: Page number (default: 1)
@@ -82,11 +92,60 @@ async def list_vms(
     - **name**: Filter by name containing this string (optional)
     """
     pagination = PaginationParams(page=page, page_size=page_size)
-    return await service.list_vms(
+    payload = await service.list_vms(
         pagination=pagination,
         state=state,
         name_filter=name,
     )
+    # Render straight to bytes; the page can hold up to 100 VMs
+    return _json_response(_VM_LIST_ADAPTER, payload)
+
+
+@router.post(
+    "/actions/bulk",
+    response_model=VMBulkActionResponse,
+    summary="Bulk VM action",
+    description="Start, stop or reboot several virtual machines in one request.",
+)
+async def bulk_vm_action(
+    bulk_request: VMBulkActionRequest,
+    service: VMServiceDep,
+) -> Response:
+    """Apply one lifecycle action to several virtual machines.
+
+    - **action**: start, stop or reboot
+    - **vm_uuids**: UUIDs of the VMs to act on (max 100)
+    - **reboot_type**: SOFT or HARD (reboot only, default: SOFT)
+
+    VMs that cannot be acted on are reported individually as failed.
+    """
+    result = await service.bulk_action(
+        action=bulk_request.action,
+        vm_uuids=bulk_request.vm_uuids,
+        reboot_type=bulk_request.reboot_type,
+    )
+    return _json_response(_BULK_ACTION_ADAPTER, result)
+
+
+@router.post(
+    "/actions/sync",
+    response_model=VMBulkActionResponse,
+    summary="Bulk sync VM state",
+    description="Synchronize the state of several VMs from OpenStack at once.",
+)
+async def bulk_sync_vm_states(
+    sync_request: VMBulkSyncRequest,
+    service: VMServiceDep,
+) -> Response:
+    """Synchronize the state of several virtual machines from OpenStack.
+
+    - **vm_uuids**: UUIDs of the VMs to sync (max 100)
+
+    VMs that are missing or not linked to an OpenStack server are reported
+    individually as failed.
+    """
+    result = await service.sync_vm_states(sync_request.vm_uuids)
+    return _json_response(_BULK_ACTION_ADAPTER, result)
 
 
 @router.get(
@@ -96,12 +155,16 @@ async def list_vms(
     description="Get detailed information about a specific VM.",
 )
 async def get_vm(
+    request: Request,
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
-) -> VMResponse:
-    """Get details of a specific virtual machine by UUID."""
-    return await service.get_vm(vm_uuid)
+) -> Response:
+    """Get details of a specific virtual machine by UUID.
+
+    Responds with 304 Not Modified when If-None-Match carries the current ETag.
+    """
+    vm = await service.get_vm(vm_uuid)
+    return etag_response(request, _VM_ADAPTER.dump_json(vm))
 
 
 @router.patch(
@@ -113,15 +176,15 @@ async def get_vm(
 async def update_vm(
     vm_data: VMUpdate,
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
-) -> VMResponse:
+) -> Response:
     """Update VM details.
 
     - **name**: New VM name (optional)
     - **description**: New description (optional)
     """
-    return await service.update_vm(vm_uuid, vm_data)
+    vm = await service.update_vm(vm_uuid, vm_data)
+    return _json_response(_VM_ADAPTER, vm)
 
 
 @router.delete(
@@ -132,14 +195,14 @@ async def update_vm(
 )
 async def delete_vm(
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
-) -> VMActionResponse:
+) -> Response:
     """Delete a virtual machine.
 
     This action is irreversible. The VM will be terminated and removed.
     """
-    return await service.delete_vm(vm_uuid)
+    result = await service.delete_vm(vm_uuid)
+    return _json_response(_ACTION_ADAPTER, result)
 
 
 @router.post(
@@ -150,14 +213,14 @@ async def delete_vm(
 )
 async def start_vm(
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
-) -> VMActionResponse:
+) -> Response:
     """Start a stopped virtual machine.
 
     The VM must be in STOPPED or SHUTOFF state.
     """
-    return await service.start_vm(vm_uuid)
+    result = await service.start_vm(vm_uuid)
+    return _json_response(_ACTION_ADAPTER, result)
 
 
 @router.post(
@@ -168,14 +231,14 @@ async def start_vm(
 )
 async def stop_vm(
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
-) -> VMActionResponse:
+) -> Response:
     """Stop a running virtual machine.
 
     The VM must be in ACTIVE or RUNNING state.
     """
-    return await service.stop_vm(vm_uuid)
+    result = await service.stop_vm(vm_uuid)
+    return _json_response(_ACTION_ADAPTER, result)
 
 
 @router.post(
@@ -186,10 +249,9 @@ async def stop_vm(
 )
 async def reboot_vm(
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
     reboot_request: VMRebootRequest = None,
-) -> VMActionResponse:
+) -> Response:
     """Reboot a running virtual machine.
 
     - **reboot_type**: SOFT (graceful) or HARD (force) reboot
@@ -198,7 +260,8 @@ async def reboot_vm(
     if reboot_request and reboot_request.reboot_type:
         reboot_type = reboot_request.reboot_type
 
-    return await service.reboot_vm(vm_uuid, reboot_type)
+    result = await service.reboot_vm(vm_uuid, reboot_type)
+    return _json_response(_ACTION_ADAPTER, result)
 
 
 @router.post(
@@ -209,11 +272,11 @@ async def reboot_vm(
 )
 async def sync_vm_state(
     service: VMServiceDep,
-    api_key: APIKeyDep,
     vm_uuid: str = Path(..., description="VM UUID"),
-) -> VMResponse:
+) -> Response:
     """Synchronize VM state from OpenStack.
 
     This fetches the current state from OpenStack and updates the local database.
     """
-    return await service.sync_vm_state(vm_uuid)
+    vm = await service.sync_vm_state(vm_uuid)
+    return _json_response(_VM_ADAPTER, vm)
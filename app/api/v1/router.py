@@ -1,27 +1,34 @@
 """API v1 main router combining all endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from app.api.v1.endpoints import vms, flavors, images, health
+from app.core.security import verify_api_key
 
 api_router = APIRouter()
 
+# Authentication applies to every resource router; nothing reads the key
+auth_dependencies = [Depends(verify_api_key)]
+
 # Include all endpoint routers
 api_router.include_router(
     vms.router,
     prefix="/vms",
+    dependencies=auth_dependencies,
     tags=["Virtual Machines"],
 )
 
 api_router.include_router(
     flavors.router,
     prefix="/flavors",
+    dependencies=auth_dependencies,
     tags=["Flavors"],
 )
 
 api_router.include_router(
     images.router,
     prefix="/images",
+    dependencies=auth_dependencies,
     tags=["Images"],
 )
 
@@ -0,0 +1,27 @@
+"""Command-line entry points for one-off maintenance tasks.
+
+Usage:
+    python -m app.cli init-db
+"""
+
+import argparse
+import asyncio
+
+from app.database import create_tables
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the requested command."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("init-db", help="Create all database tables")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "init-db":
+        asyncio.run(create_tables())
+        print("Database tables created/verified")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
-from typing import Optional
+from typing import Annotated, Optional
 
+from fastapi import Depends
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     api_title: str = Field(default="OpenStack VM Lifecycle API")
     api_version: str = Field(default="1.0.0")
     debug: bool = Field(default=False)
+    # Root log level; WARNING in production skips INFO formatting entirely
+    log_level: str = Field(default="INFO")
 
     # API Key Authentication
     api_key: str = Field(default="dev-api-key-change-in-production")
@@ -29,10 +31,25 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="sqlite+aiosqlite:///./openstack_vm.db"
     )
+    # Connection pool (ignored for SQLite)
+    database_pool_size: int = Field(default=25)
+    database_max_overflow: int = Field(default=25)
+    database_pool_pre_ping: bool = Field(default=True)
+    database_pool_recycle: int = Field(default=1800)
+    # Reuse the most recently returned connection so idle ones can age out
+    database_pool_use_lifo: bool = Field(default=True)
+    # Disable pooling when an external pooler such as PgBouncer is used
+    database_use_null_pool: bool = Field(default=False)
+    # Create missing tables at startup; disable when schema is managed
+    # out of band (python -m app.cli init-db, migrations)
+    auto_create_tables: bool = Field(default=True)
 
     # OpenStack Configuration
     use_mock_openstack: bool = Field(default=True)
 
+    # Seconds to cache flavor/image catalogs, which change rarely
+    catalog_cache_ttl: int = Field(default=300)
+
     # OpenStack Credentials
     os_auth_url: Optional[str] = Field(default=None)
     os_project_name: Optional[str] = Field(default=None)
@@ -46,10 +63,26 @@ class Settings(BaseSettings):
     os_application_credential_id: Optional[str] = Field(default=None)
     os_application_credential_secret: Optional[str] = Field(default=None)
 
+    # Max keep-alive HTTP connections per OpenStack endpoint
+    openstack_pool_size: int = Field(default=50)
+    # Worker threads for blocking SDK calls (keep <= openstack_pool_size)
+    openstack_max_workers: int = Field(default=32)
+
+    # CORS (explicit methods/headers let the middleware use precomputed headers)
+    cors_origins: list[str] = Field(default=["*"])
+    cors_methods: list[str] = Field(
+        default=["GET", "POST", "PATCH", "DELETE", "OPTIONS"]
+    )
+    cors_headers: list[str] = Field(
+        default=["X-API-Key", "Content-Type", "If-None-Match"]
+    )
+
     # Server Configuration
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000)
     reload: bool = Field(default=False)
+    # Worker processes; defaults to one per CPU (always 1 with reload)
+    workers: Optional[int] = Field(default=None)
 
     @property
     def openstack_credentials_configured(self) -> bool:
@@ -64,7 +97,14 @@ class Settings(BaseSettings):
         ])
 
 
-@lru_cache
+# Settings are read from the environment once, at import
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the application settings instance."""
+    return SETTINGS
+
+
+# Type alias for dependency injection (overridable in tests)
+SettingsDep = Annotated[Settings, Depends(get_settings)]
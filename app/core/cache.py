@@ -0,0 +1,85 @@
+"""In-process caching helpers."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls for the same key into one in-flight call.
+
+    Nothing is kept once the call finishes; the next caller starts fresh.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the in-flight call registry."""
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run factory for key, or join a call for key already in flight.
+
+        Args:
+            key: Call key
+            factory: Coroutine function producing the value
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield the shared task so one cancelled caller doesn't fail the rest
+        return await asyncio.shield(task)
+
+
+class TTLCache(Generic[T]):
+    """Async-safe in-memory cache with a fixed time-to-live per entry.
+
+    Concurrent misses for the same key share a single in-flight call to the
+    factory instead of each issuing their own request.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached value stays valid
+        """
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, T]] = {}
+        self._flight: SingleFlight[T] = SingleFlight()
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, calling factory on a miss.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value
+
+        Returns:
+            Cached or freshly produced value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+
+        async def load() -> T:
+            # Errors propagate before storing, so they are never cached
+            value = await factory()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+        return await self._flight.do(key, load)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one cached entry, or all entries when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -0,0 +1,42 @@
+"""Cheap wall-clock timestamps for hot paths."""
+
+import time
+from datetime import datetime, timezone
+
+_cached_second = -1
+_cached_now = datetime.fromtimestamp(0, tz=timezone.utc)
+_cached_iso = _cached_now.isoformat()
+
+
+def _refresh() -> None:
+    """Rebuild the cached timestamp if the wall-clock second has changed."""
+    global _cached_second, _cached_now, _cached_iso
+
+    second = time.time_ns() // 1_000_000_000
+    if second != _cached_second:
+        _cached_now = datetime.fromtimestamp(second, tz=timezone.utc)
+        _cached_iso = _cached_now.isoformat()
+        _cached_second = second
+
+
+def utc_now_coarse() -> datetime:
+    """Return the current UTC time at one-second resolution.
+
+    The datetime is built at most once per second and shared between
+    callers, which is plenty for response timestamps.
+
+    Returns:
+        Timezone-aware UTC datetime truncated to the second
+    """
+    _refresh()
+    return _cached_now
+
+
+def utc_iso_coarse() -> str:
+    """Return utc_now_coarse() as a cached ISO-8601 string.
+
+    Returns:
+        ISO-8601 UTC timestamp truncated to the second
+    """
+    _refresh()
+    return _cached_iso
@@ -0,0 +1,56 @@
+"""ETag helpers for conditional GET requests."""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def compute_etag(content: bytes) -> str:
+    """Compute a strong ETag for a rendered response body.
+
+    Args:
+        content: Response body bytes
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def etag_response(request: Request, content: bytes) -> Response:
+    """Build a JSON response carrying an ETag, or a 304 if the client has it.
+
+    Args:
+        request: Incoming request
+        content: Rendered JSON body
+
+    Returns:
+        200 response with the body, or an empty 304 response
+    """
+    etag = compute_etag(content)
+    headers = {"ETag": etag}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
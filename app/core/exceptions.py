@@ -2,6 +2,8 @@
 
 from typing import Any, Optional
 
+import orjson
+
 
 class APIException(Exception):
     """Base exception for all API errors."""
@@ -26,6 +28,26 @@ class APIException(Exception):
         self.status_code = status_code
         self.error_code = error_code or self.__class__.__name__
         self.details = details or {}
+        # Everything but the timestamp is known now, so serialize it once
+        self._body_prefix = orjson.dumps(
+            {
+                "error": self.error_code,
+                "message": self.message,
+                "details": self.details,
+            },
+            default=str,
+        )[:-1]
+
+    def render_body(self, timestamp: str) -> bytes:
+        """Render the JSON error body.
+
+        Args:
+            timestamp: ISO-8601 timestamp to include in the body
+
+        Returns:
+            Serialized error response body
+        """
+        return self._body_prefix + b',"timestamp":"' + timestamp.encode() + b'"}'
 
 
 class AuthenticationException(APIException):
@@ -130,6 +152,8 @@ class OpenStackException(APIException):
         message: str,
         openstack_error: Optional[str] = None,
         details: Optional[dict[str, Any]] = None,
+        status_code: int = 502,
+        error_code: str = "OPENSTACK_ERROR",
     ) -> None:
         """Initialize OpenStack exception."""
         error_details = details or {}
@@ -138,8 +162,8 @@ class OpenStackException(APIException):
 
         super().__init__(
             message=message,
-            status_code=502,
-            error_code="OPENSTACK_ERROR",
+            status_code=status_code,
+            error_code=error_code,
             details=error_details,
         )
 
@@ -156,9 +180,9 @@ class OpenStackConnectionException(OpenStackException):
         super().__init__(
             message=message,
             details=details,
+            status_code=503,
+            error_code="OPENSTACK_CONNECTION_ERROR",
         )
-        self.error_code = "OPENSTACK_CONNECTION_ERROR"
-        self.status_code = 503
 
 
 class ResourceNotFoundException(APIException):
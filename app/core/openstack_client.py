@@ -1,13 +1,20 @@
 """OpenStack client wrapper with mock support."""
 
+import asyncio
 import logging
-import random
+import os
+import threading
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Optional
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Optional, TypeVar
 
 from app.config import Settings, get_settings
+from app.core.cache import TTLCache
 from app.core.exceptions import (
     OpenStackConnectionException,
     OpenStackException,
@@ -16,6 +23,49 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _freeze(items: list[dict[str, Any]]) -> tuple[Mapping[str, Any], ...]:
+    """Wrap static mock records as read-only mappings."""
+    return tuple(MappingProxyType(item) for item in items)
+
+
+def _flavor_to_dict(flavor: Any) -> dict[str, Any]:
+    """Convert an OpenStack flavor resource to a dictionary."""
+    return {
+        "id": flavor.id,
+        "name": flavor.name,
+        "vcpus": flavor.vcpus,
+        "memory_mb": flavor.ram,
+        "disk_gb": flavor.disk,
+        "ephemeral_gb": flavor.ephemeral or 0,
+        "swap_mb": flavor.swap or 0,
+        "is_public": flavor.is_public,
+        "description": flavor.description,
+    }
+
+
+def _image_to_dict(image: Any) -> dict[str, Any]:
+    """Convert an OpenStack image resource to a dictionary."""
+    return {
+        "id": image.id,
+        "name": image.name,
+        "status": image.status,
+        "size_bytes": image.size,
+        "min_disk_gb": image.min_disk or 0,
+        "min_memory_mb": image.min_ram or 0,
+        "os_distro": image.os_distro,
+        "os_version": image.os_version,
+        "architecture": image.architecture,
+        "created_at": image.created_at,
+        "description": image.get("description"),
+    }
+
+
+# Decimal strings for every IPv4 octet, so mock IPs need no int formatting
+_OCTETS = tuple(str(i) for i in range(256))
+
 
 class BaseOpenStackClient(ABC):
     """Abstract base class for OpenStack client."""
@@ -62,22 +112,22 @@ class BaseOpenStackClient(ABC):
         pass
 
     @abstractmethod
-    async def list_flavors(self) -> list[dict[str, Any]]:
+    async def list_flavors(self) -> Sequence[Mapping[str, Any]]:
         """List available flavors."""
         pass
 
     @abstractmethod
-    async def get_flavor(self, flavor_id: str) -> dict[str, Any]:
+    async def get_flavor(self, flavor_id: str) -> Mapping[str, Any]:
         """Get flavor details."""
         pass
 
     @abstractmethod
-    async def list_images(self) -> list[dict[str, Any]]:
+    async def list_images(self) -> Sequence[Mapping[str, Any]]:
         """List available images."""
         pass
 
     @abstractmethod
-    async def get_image(self, image_id: str) -> dict[str, Any]:
+    async def get_image(self, image_id: str) -> Mapping[str, Any]:
         """Get image details."""
         pass
 
@@ -86,144 +136,163 @@ class BaseOpenStackClient(ABC):
         """Check if connection to OpenStack is working."""
         pass
 
+    # Deliberately concrete: clients holding no connections inherit the no-op
+    async def close(self) -> None:  # noqa: B027
+        """Release any connections held by the client."""
+
 
 class MockOpenStackClient(BaseOpenStackClient):
     """Mock OpenStack client for testing without real OpenStack."""
 
-    # Mock data storage
-    _servers: dict[str, dict[str, Any]] = {}
-
     # Predefined mock flavors
-    MOCK_FLAVORS = [
-        {
-            "id": "m1.tiny",
-            "name": "Tiny",
-            "vcpus": 1,
-            "memory_mb": 512,
-            "disk_gb": 1,
-            "ephemeral_gb": 0,
-            "swap_mb": 0,
-            "is_public": True,
-            "description": "Tiny instance for testing",
-        },
-        {
-            "id": "m1.small",
-            "name": "Small",
-            "vcpus": 1,
-            "memory_mb": 2048,
-            "disk_gb": 20,
-            "ephemeral_gb": 0,
-            "swap_mb": 0,
-            "is_public": True,
-            "description": "Small instance for light workloads",
-        },
-        {
-            "id": "m1.medium",
-            "name": "Medium",
-            "vcpus": 2,
-            "memory_mb": 4096,
-            "disk_gb": 40,
-            "ephemeral_gb": 0,
-            "swap_mb": 0,
-            "is_public": True,
-            "description": "Medium instance for general workloads",
-        },
-        {
-            "id": "m1.large",
-            "name": "Large",
-            "vcpus": 4,
-            "memory_mb": 8192,
-            "disk_gb": 80,
-            "ephemeral_gb": 0,
-            "swap_mb": 0,
-            "is_public": True,
-            "description": "Large instance for demanding workloads",
-        },
-        {
-            "id": "m1.xlarge",
-            "name": "Extra Large",
-            "vcpus": 8,
-            "memory_mb": 16384,
-            "disk_gb": 160,
-            "ephemeral_gb": 0,
-            "swap_mb": 0,
-            "is_public": True,
-            "description": "Extra large instance for heavy workloads",
-        },
-    ]
+    MOCK_FLAVORS: tuple[Mapping[str, Any], ...] = _freeze(
+        [
+            {
+                "id": "m1.tiny",
+                "name": "Tiny",
+                "vcpus": 1,
+                "memory_mb": 512,
+                "disk_gb": 1,
+                "ephemeral_gb": 0,
+                "swap_mb": 0,
+                "is_public": True,
+                "description": "Tiny instance for testing",
+            },
+            {
+                "id": "m1.small",
+                "name": "Small",
+                "vcpus": 1,
+                "memory_mb": 2048,
+                "disk_gb": 20,
+                "ephemeral_gb": 0,
+                "swap_mb": 0,
+                "is_public": True,
+                "description": "Small instance for light workloads",
+            },
+            {
+                "id": "m1.medium",
+                "name": "Medium",
+                "vcpus": 2,
+                "memory_mb": 4096,
+                "disk_gb": 40,
+                "ephemeral_gb": 0,
+                "swap_mb": 0,
+                "is_public": True,
+                "description": "Medium instance for general workloads",
+            },
+            {
+                "id": "m1.large",
+                "name": "Large",
+                "vcpus": 4,
+                "memory_mb": 8192,
+                "disk_gb": 80,
+                "ephemeral_gb": 0,
+                "swap_mb": 0,
+                "is_public": True,
+                "description": "Large instance for demanding workloads",
+            },
+            {
+                "id": "m1.xlarge",
+                "name": "Extra Large",
+                "vcpus": 8,
+                "memory_mb": 16384,
+                "disk_gb": 160,
+                "ephemeral_gb": 0,
+                "swap_mb": 0,
+                "is_public": True,
+                "description": "Extra large instance for heavy workloads",
+            },
+        ]
+    )
 
     # Predefined mock images
-    MOCK_IMAGES = [
-        {
-            "id": "ubuntu-22.04",
-            "name": "Ubuntu 22.04 LTS",
-            "status": "active",
-            "size_bytes": 2361393152,
-            "min_disk_gb": 8,
-            "min_memory_mb": 512,
-            "os_distro": "ubuntu",
-            "os_version": "22.04",
-            "architecture": "x86_64",
-            "created_at": datetime(2024, 1, 15, 10, 30, 0),
-            "description": "Ubuntu 22.04 LTS (Jammy Jellyfish)",
-        },
-        {
-            "id": "ubuntu-20.04",
-            "name": "Ubuntu 20.04 LTS",
-            "status": "active",
-            "size_bytes": 2147483648,
-            "min_disk_gb": 8,
-            "min_memory_mb": 512,
-            "os_distro": "ubuntu",
-            "os_version": "20.04",
-            "architecture": "x86_64",
-            "created_at": datetime(2023, 6, 1, 8, 0, 0),
-            "description": "Ubuntu 20.04 LTS (Focal Fossa)",
-        },
-        {
-            "id": "centos-9",
-            "name": "CentOS Stream 9",
-            "status": "active",
-            "size_bytes": 1932735283,
-            "min_disk_gb": 10,
-            "min_memory_mb": 1024,
-            "os_distro": "centos",
-            "os_version": "9",
-            "architecture": "x86_64",
-            "created_at": datetime(2024, 2, 1, 12, 0, 0),
-            "description": "CentOS Stream 9",
-        },
-        {
-            "id": "debian-12",
-            "name": "Debian 12 (Bookworm)",
-            "status": "active",
-            "size_bytes": 2048000000,
-            "min_disk_gb": 8,
-            "min_memory_mb": 512,
-            "os_distro": "debian",
-            "os_version": "12",
-            "architecture": "x86_64",
-            "created_at": datetime(2024, 1, 20, 14, 0, 0),
-            "description": "Debian 12 (Bookworm) stable",
-        },
-        {
-            "id": "windows-2022",
-            "name": "Windows Server 2022",
-            "status": "active",
-            "size_bytes": 15032385536,
-            "min_disk_gb": 40,
-            "min_memory_mb": 2048,
-            "os_distro": "windows",
-            "os_version": "2022",
-            "architecture": "x86_64",
-            "created_at": datetime(2024, 1, 10, 9, 0, 0),
-            "description": "Windows Server 2022 Datacenter",
-        },
-    ]
+    MOCK_IMAGES: tuple[Mapping[str, Any], ...] = _freeze(
+        [
+            {
+                "id": "ubuntu-22.04",
+                "name": "Ubuntu 22.04 LTS",
+                "status": "active",
+                "size_bytes": 2361393152,
+                "min_disk_gb": 8,
+                "min_memory_mb": 512,
+                "os_distro": "ubuntu",
+                "os_version": "22.04",
+                "architecture": "x86_64",
+                "created_at": datetime(2024, 1, 15, 10, 30, 0),
+                "description": "Ubuntu 22.04 LTS (Jammy Jellyfish)",
+            },
+            {
+                "id": "ubuntu-20.04",
+                "name": "Ubuntu 20.04 LTS",
+                "status": "active",
+                "size_bytes": 2147483648,
+                "min_disk_gb": 8,
+                "min_memory_mb": 512,
+                "os_distro": "ubuntu",
+                "os_version": "20.04",
+                "architecture": "x86_64",
+                "created_at": datetime(2023, 6, 1, 8, 0, 0),
+                "description": "Ubuntu 20.04 LTS (Focal Fossa)",
+            },
+            {
+                "id": "centos-9",
+                "name": "CentOS Stream 9",
+                "status": "active",
+                "size_bytes": 1932735283,
+                "min_disk_gb": 10,
+                "min_memory_mb": 1024,
+                "os_distro": "centos",
+                "os_version": "9",
+                "architecture": "x86_64",
+                "created_at": datetime(2024, 2, 1, 12, 0, 0),
+                "description": "CentOS Stream 9",
+            },
+            {
+                "id": "debian-12",
+                "name": "Debian 12 (Bookworm)",
+                "status": "active",
+                "size_bytes": 2048000000,
+                "min_disk_gb": 8,
+                "min_memory_mb": 512,
+                "os_distro": "debian",
+                "os_version": "12",
+                "architecture": "x86_64",
+                "created_at": datetime(2024, 1, 20, 14, 0, 0),
+                "description": "Debian 12 (Bookworm) stable",
+            },
+            {
+                "id": "windows-2022",
+                "name": "Windows Server 2022",
+                "status": "active",
+                "size_bytes": 15032385536,
+                "min_disk_gb": 40,
+                "min_memory_mb": 2048,
+                "os_distro": "windows",
+                "os_version": "2022",
+                "architecture": "x86_64",
+                "created_at": datetime(2024, 1, 10, 9, 0, 0),
+                "description": "Windows Server 2022 Datacenter",
+            },
+        ]
+    )
+
+    # ID indexes for O(1) lookups
+    _FLAVORS_BY_ID = {flavor["id"]: flavor for flavor in MOCK_FLAVORS}
+    _IMAGES_BY_ID = {image["id"]: image for image in MOCK_IMAGES}
+
+    def __init__(self) -> None:
+        """Initialize the mock client with an empty server store.
+
+        The store belongs to the instance rather than the class. Every
+        access is a single dict operation with no await in between, so it
+        stays consistent without a lock on the event loop.
+        """
+        self._servers: dict[str, dict[str, Any]] = {}
 
     def _generate_ip(self) -> str:
         """Generate a random private IP address."""
-        return f"192.168.{random.randint(1, 254)}.{random.randint(1, 254)}"
+        b = os.urandom(2)
+        return "192.168." + _OCTETS[1 + b[0] % 254] + "." + _OCTETS[1 + b[1] % 254]
 
     async def create_server(
         self,
@@ -245,7 +314,7 @@ class MockOpenStackClient(BaseOpenStackClient):
         await self.get_image(image_id)
 
         server_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         server = {
             "id": server_id,
@@ -266,69 +335,68 @@ class MockOpenStackClient(BaseOpenStackClient):
         }
 
         self._servers[server_id] = server
-        logger.info(f"Mock: Created server {server_id} ({name})")
+        logger.info("Mock: Created server %s (%s)", server_id, name)
         return server
 
     async def get_server(self, server_id: str) -> dict[str, Any]:
         """Get mock server details."""
-        if server_id not in self._servers:
+        server = self._servers.get(server_id)
+        if server is None:
             raise ResourceNotFoundException("Server", server_id)
-        return self._servers[server_id]
+        return server
 
     async def delete_server(self, server_id: str) -> bool:
         """Delete a mock server."""
-        if server_id not in self._servers:
+        if self._servers.pop(server_id, None) is None:
             raise ResourceNotFoundException("Server", server_id)
-
-        del self._servers[server_id]
-        logger.info(f"Mock: Deleted server {server_id}")
+        logger.info("Mock: Deleted server %s", server_id)
         return True
 
     async def start_server(self, server_id: str) -> bool:
         """Start a mock server."""
         server = await self.get_server(server_id)
         server["status"] = "ACTIVE"
-        server["updated_at"] = datetime.utcnow()
-        logger.info(f"Mock: Started server {server_id}")
+        server["updated_at"] = datetime.now(timezone.utc)
+        logger.info("Mock: Started server %s", server_id)
         return True
 
     async def stop_server(self, server_id: str) -> bool:
         """Stop a mock server."""
         server = await self.get_server(server_id)
         server["status"] = "SHUTOFF"
-        server["updated_at"] = datetime.utcnow()
-        logger.info(f"Mock: Stopped server {server_id}")
+        server["updated_at"] = datetime.now(timezone.utc)
+        logger.info("Mock: Stopped server %s", server_id)
         return True
 
     async def reboot_server(self, server_id: str, reboot_type: str = "SOFT") -> bool:
         """Reboot a mock server."""
         server = await self.get_server(server_id)
         server["status"] = "ACTIVE"
-        server["updated_at"] = datetime.utcnow()
-        logger.info(f"Mock: Rebooted server {server_id} ({reboot_type})")
+        server["updated_at"] = datetime.now(timezone.utc)
+        logger.info("Mock: Rebooted server %s (%s)", server_id, reboot_type)
         return True
 
-    async def list_flavors(self) -> list[dict[str, Any]]:
+    async def list_flavors(self) -> Sequence[Mapping[str, Any]]:
         """List mock flavors."""
-        return self.MOCK_FLAVORS.copy()
+        return self.MOCK_FLAVORS
 
-    async def get_flavor(self, flavor_id: str) -> dict[str, Any]:
+    async def get_flavor(self, flavor_id: str) -> Mapping[str, Any]:
         """Get mock flavor details."""
-        for flavor in self.MOCK_FLAVORS:
-            if flavor["id"] == flavor_id:
-                return flavor
-        raise ResourceNotFoundException("Flavor", flavor_id)
+        flavor = self._FLAVORS_BY_ID.get(flavor_id)
+        if flavor is None:
+            raise ResourceNotFoundException("Flavor", flavor_id)
+        return flavor
 
-    async def list_images(self) -> list[dict[str, Any]]:
+    async def list_images(self) -> Sequence[Mapping[str, Any]]:
         """List mock images."""
-        return self.MOCK_IMAGES.copy()
+        return self.MOCK_IMAGES
 
-    async def get_image(self, image_id: str) -> dict[str, Any]:
+    async def get_image(self, image_id: str) -> Mapping[str, Any]:
         """Get mock image details."""
-        for image in self.MOCK_IMAGES:
-            if image["id"] == image_id:
-                return image
-        raise ResourceNotFoundException("Image", image_id)
+        image = self._IMAGES_BY_ID.get(image_id)
+        if image is None:
+            raise ResourceNotFoundException("Image", image_id)
+        return image
 
     async def check_connection(self) -> bool:
         """Mock connection check always succeeds."""
@@ -338,55 +406,117 @@ class MockOpenStackClient(BaseOpenStackClient):
 class RealOpenStackClient(BaseOpenStackClient):
     """Real OpenStack client using openstacksdk."""
 
+    # Page size for catalog listings; the SDK follows the next links itself
+    CATALOG_PAGE_SIZE = 100
+
     def __init__(self, settings: Settings) -> None:
         """Initialize the real OpenStack client."""
         self.settings = settings
         self._connection = None
+        self._connection_lock = threading.Lock()
+        # openstacksdk is synchronous; its calls run here, off the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.openstack_max_workers,
+            thread_name_prefix="openstack",
+        )
+        # Flavors and images change rarely; create_vm looks both up every time
+        self._flavor_cache: TTLCache[Mapping[str, Any]] = TTLCache(
+            ttl=settings.catalog_cache_ttl
+        )
+        self._image_cache: TTLCache[Mapping[str, Any]] = TTLCache(
+            ttl=settings.catalog_cache_ttl
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking SDK call on the client's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
 
     def _get_connection(self) -> Any:
-        """Get or create OpenStack connection."""
+        """Get or create OpenStack connection.
+
+        Safe to call from several worker threads; only one of them builds
+        the connection.
+        """
         if self._connection is None:
-            try:
-                import openstack
-
-                # Configure connection from settings
-                if self.settings.os_application_credential_id:
-                    # Use application credentials
-                    self._connection = openstack.connect(
-                        auth_url=self.settings.os_auth_url,
-                        application_credential_id=self.settings.os_application_credential_id,
-                        application_credential_secret=self.settings.os_application_credential_secret,
-                        region_name=self.settings.os_region_name,
-                    )
-                else:
-                    # Use username/password
-                    self._connection = openstack.connect(
-                        auth_url=self.settings.os_auth_url,
-                        project_name=self.settings.os_project_name,
-                        project_domain_name=self.settings.os_project_domain_name,
-                        username=self.settings.os_username,
-                        password=self.settings.os_password,
-                        user_domain_name=self.settings.os_user_domain_name,
-                        region_name=self.settings.os_region_name,
-                    )
-            except Exception as e:
-                logger.error(f"Failed to connect to OpenStack: {e}")
-                raise OpenStackConnectionException(
-                    message=f"Failed to connect to OpenStack: {str(e)}"
-                )
+            with self._connection_lock:
+                if self._connection is None:
+                    self._connection = self._open_connection()
 
         return self._connection
 
+    def _open_connection(self) -> Any:
+        """Open a new OpenStack connection from settings."""
+        try:
+            import openstack
+
+            # Configure connection from settings
+            if self.settings.os_application_credential_id:
+                # Use application credentials
+                conn = openstack.connect(
+                    auth_url=self.settings.os_auth_url,
+                    application_credential_id=self.settings.os_application_credential_id,
+                    application_credential_secret=self.settings.os_application_credential_secret,
+                    region_name=self.settings.os_region_name,
+                )
+            else:
+                # Use username/password
+                conn = openstack.connect(
+                    auth_url=self.settings.os_auth_url,
+                    project_name=self.settings.os_project_name,
+                    project_domain_name=self.settings.os_project_domain_name,
+                    username=self.settings.os_username,
+                    password=self.settings.os_password,
+                    user_domain_name=self.settings.os_user_domain_name,
+                    region_name=self.settings.os_region_name,
+                )
+            self._configure_http_pool(conn)
+        except Exception as e:
+            logger.error("Failed to connect to OpenStack: %s", e)
+            raise OpenStackConnectionException(
+                message=f"Failed to connect to OpenStack: {str(e)}"
+            )
+
+        return conn
+
+    async def _connect(self) -> Any:
+        """Get the OpenStack connection without blocking the event loop.
+
+        Building the connection reads cloud config and loads auth plugins,
+        so the first call happens on the worker pool.
+        """
+        if self._connection is not None:
+            return self._connection
+        return await self._run(self._get_connection)
+
+    def _configure_http_pool(self, conn: Any) -> None:
+        """Mount a bounded keep-alive pool on the SDK's HTTP session.
+
+        All Keystone/Nova/Glance calls go through one requests session, so
+        TCP and TLS connections are reused instead of re-established.
+        """
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(
+            pool_maxsize=self.settings.openstack_pool_size,
+            pool_block=True,
+        )
+        conn.session.session.mount("https://", adapter)
+        conn.session.session.mount("http://", adapter)
+
     def _server_to_dict(self, server: Any) -> dict[str, Any]:
         """Convert OpenStack server object to dictionary."""
+        ip_address, floating_ip = self._extract_ips(server)
         return {
             "id": server.id,
             "name": server.name,
             "status": server.status,
             "flavor_id": server.flavor.get("id") if server.flavor else None,
             "image_id": server.image.get("id") if server.image else None,
-            "ip_address": self._get_server_ip(server),
-            "floating_ip": self._get_floating_ip(server),
+            "ip_address": ip_address,
+            "floating_ip": floating_ip,
             "key_name": server.key_name,
             "created_at": server.created_at,
             "updated_at": server.updated_at,
@@ -394,23 +524,21 @@ class RealOpenStackClient(BaseOpenStackClient):
             "metadata": server.metadata or {},
         }
 
-    def _get_server_ip(self, server: Any) -> Optional[str]:
-        """Extract private IP from server addresses."""
-        if server.addresses:
-            for network, addresses in server.addresses.items():
-                for addr in addresses:
-                    if addr.get("OS-EXT-IPS:type") == "fixed":
-                        return addr.get("addr")
-        return None
-
-    def _get_floating_ip(self, server: Any) -> Optional[str]:
-        """Extract floating IP from server addresses."""
-        if server.addresses:
-            for network, addresses in server.addresses.items():
-                for addr in addresses:
-                    if addr.get("OS-EXT-IPS:type") == "floating":
-                        return addr.get("addr")
-        return None
+    def _extract_ips(self, server: Any) -> tuple[Optional[str], Optional[str]]:
+        """Extract the private and floating IPs in one pass over addresses."""
+        fixed = floating = None
+        if not server.addresses:
+            return None, None
+        for addresses in server.addresses.values():
+            for addr in addresses:
+                ip_type = addr.get("OS-EXT-IPS:type")
+                if ip_type == "fixed" and fixed is None:
+                    fixed = addr.get("addr")
+                elif ip_type == "floating" and floating is None:
+                    floating = addr.get("addr")
+                if fixed is not None and floating is not None:
+                    return fixed, floating
+        return fixed, floating
 
     async def create_server(
         self,
@@ -426,7 +554,7 @@ class RealOpenStackClient(BaseOpenStackClient):
     ) -> dict[str, Any]:
         """Create a server in OpenStack."""
         try:
-            conn = self._get_connection()
+            conn = await self._connect()
 
             # Build server creation kwargs
             kwargs: dict[str, Any] = {
@@ -450,14 +578,14 @@ class RealOpenStackClient(BaseOpenStackClient):
             if metadata:
                 kwargs["meta"] = metadata
 
-            server = conn.compute.create_server(**kwargs)
-            server = conn.compute.wait_for_server(server)
+            server = await self._run(conn.compute.create_server, **kwargs)
+            server = await self._run(conn.compute.wait_for_server, server)
 
-            logger.info(f"OpenStack: Created server {server.id} ({name})")
+            logger.info("OpenStack: Created server %s (%s)", server.id, name)
             return self._server_to_dict(server)
 
         except Exception as e:
-            logger.error(f"Failed to create server: {e}")
+            logger.error("Failed to create server: %s", e)
             raise OpenStackException(
                 message=f"Failed to create server: {str(e)}",
                 openstack_error=str(e),
@@ -466,15 +594,15 @@ class RealOpenStackClient(BaseOpenStackClient):
     async def get_server(self, server_id: str) -> dict[str, Any]:
         """Get server details from OpenStack."""
         try:
-            conn = self._get_connection()
-            server = conn.compute.get_server(server_id)
+            conn = await self._connect()
+            server = await self._run(conn.compute.get_server, server_id)
             if server is None:
                 raise ResourceNotFoundException("Server", server_id)
             return self._server_to_dict(server)
         except ResourceNotFoundException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get server {server_id}: {e}")
+            logger.error("Failed to get server %s: %s", server_id, e)
             raise OpenStackException(
                 message=f"Failed to get server: {str(e)}",
                 openstack_error=str(e),
@@ -483,12 +611,12 @@ class RealOpenStackClient(BaseOpenStackClient):
     async def delete_server(self, server_id: str) -> bool:
         """Delete a server from OpenStack."""
         try:
-            conn = self._get_connection()
-            conn.compute.delete_server(server_id)
-            logger.info(f"OpenStack: Deleted server {server_id}")
+            conn = await self._connect()
+            await self._run(conn.compute.delete_server, server_id)
+            logger.info("OpenStack: Deleted server %s", server_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete server {server_id}: {e}")
+            logger.error("Failed to delete server %s: %s", server_id, e)
             raise OpenStackException(
                 message=f"Failed to delete server: {str(e)}",
                 openstack_error=str(e),
@@ -497,12 +625,12 @@ class RealOpenStackClient(BaseOpenStackClient):
     async def start_server(self, server_id: str) -> bool:
         """Start a server in OpenStack."""
         try:
-            conn = self._get_connection()
-            conn.compute.start_server(server_id)
-            logger.info(f"OpenStack: Started server {server_id}")
+            conn = await self._connect()
+            await self._run(conn.compute.start_server, server_id)
+            logger.info("OpenStack: Started server %s", server_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to start server {server_id}: {e}")
+            logger.error("Failed to start server %s: %s", server_id, e)
             raise OpenStackException(
                 message=f"Failed to start server: {str(e)}",
                 openstack_error=str(e),
@@ -511,12 +639,12 @@ class RealOpenStackClient(BaseOpenStackClient):
     async def stop_server(self, server_id: str) -> bool:
         """Stop a server in OpenStack."""
         try:
-            conn = self._get_connection()
-            conn.compute.stop_server(server_id)
-            logger.info(f"OpenStack: Stopped server {server_id}")
+            conn = await self._connect()
+            await self._run(conn.compute.stop_server, server_id)
+            logger.info("OpenStack: Stopped server %s", server_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to stop server {server_id}: {e}")
+            logger.error("Failed to stop server %s: %s", server_id, e)
             raise OpenStackException(
                 message=f"Failed to stop server: {str(e)}",
                 openstack_error=str(e),
@@ -525,120 +653,89 @@ class RealOpenStackClient(BaseOpenStackClient):
     async def reboot_server(self, server_id: str, reboot_type: str = "SOFT") -> bool:
         """Reboot a server in OpenStack."""
         try:
-            conn = self._get_connection()
-            conn.compute.reboot_server(server_id, reboot_type)
-            logger.info(f"OpenStack: Rebooted server {server_id} ({reboot_type})")
+            conn = await self._connect()
+            await self._run(conn.compute.reboot_server, server_id, reboot_type)
+            logger.info("OpenStack: Rebooted server %s (%s)", server_id, reboot_type)
             return True
         except Exception as e:
-            logger.error(f"Failed to reboot server {server_id}: {e}")
+            logger.error("Failed to reboot server %s: %s", server_id, e)
             raise OpenStackException(
                 message=f"Failed to reboot server: {str(e)}",
                 openstack_error=str(e),
             )
 
-    async def list_flavors(self) -> list[dict[str, Any]]:
+    async def list_flavors(self) -> Sequence[Mapping[str, Any]]:
         """List flavors from OpenStack."""
         try:
-            conn = self._get_connection()
-            flavors = []
-            for flavor in conn.compute.flavors():
-                flavors.append({
-                    "id": flavor.id,
-                    "name": flavor.name,
-                    "vcpus": flavor.vcpus,
-                    "memory_mb": flavor.ram,
-                    "disk_gb": flavor.disk,
-                    "ephemeral_gb": flavor.ephemeral,
-                    "swap_mb": flavor.swap or 0,
-                    "is_public": flavor.is_public,
-                    "description": flavor.description,
-                })
-            return flavors
+            conn = await self._connect()
+            # The SDK pages lazily; drain the generator on the worker thread
+            flavors = await self._run(
+                list, conn.compute.flavors(limit=self.CATALOG_PAGE_SIZE)
+            )
+            return [_flavor_to_dict(flavor) for flavor in flavors]
         except Exception as e:
-            logger.error(f"Failed to list flavors: {e}")
+            logger.error("Failed to list flavors: %s", e)
             raise OpenStackException(
                 message=f"Failed to list flavors: {str(e)}",
                 openstack_error=str(e),
             )
 
-    async def get_flavor(self, flavor_id: str) -> dict[str, Any]:
-        """Get flavor details from OpenStack."""
+    async def get_flavor(self, flavor_id: str) -> Mapping[str, Any]:
+        """Get flavor details from OpenStack (cached)."""
+        return await self._flavor_cache.get_or_set(
+            flavor_id, partial(self._fetch_flavor, flavor_id)
+        )
+
+    async def _fetch_flavor(self, flavor_id: str) -> Mapping[str, Any]:
+        """Fetch flavor details from OpenStack."""
         try:
-            conn = self._get_connection()
-            flavor = conn.compute.find_flavor(flavor_id)
+            conn = await self._connect()
+            flavor = await self._run(conn.compute.find_flavor, flavor_id)
             if flavor is None:
                 raise ResourceNotFoundException("Flavor", flavor_id)
-            return {
-                "id": flavor.id,
-                "name": flavor.name,
-                "vcpus": flavor.vcpus,
-                "memory_mb": flavor.ram,
-                "disk_gb": flavor.disk,
-                "ephemeral_gb": flavor.ephemeral,
-                "swap_mb": flavor.swap or 0,
-                "is_public": flavor.is_public,
-                "description": flavor.description,
-            }
+            return _flavor_to_dict(flavor)
         except ResourceNotFoundException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get flavor {flavor_id}: {e}")
+            logger.error("Failed to get flavor %s: %s", flavor_id, e)
             raise OpenStackException(
                 message=f"Failed to get flavor: {str(e)}",
                 openstack_error=str(e),
             )
 
-    async def list_images(self) -> list[dict[str, Any]]:
+    async def list_images(self) -> Sequence[Mapping[str, Any]]:
         """List images from OpenStack."""
         try:
-            conn = self._get_connection()
-            images = []
-            for image in conn.image.images():
-                images.append({
-                    "id": image.id,
-                    "name": image.name,
-                    "status": image.status,
-                    "size_bytes": image.size,
-                    "min_disk_gb": image.min_disk,
-                    "min_memory_mb": image.min_ram,
-                    "os_distro": image.os_distro,
-                    "os_version": image.os_version,
-                    "architecture": image.architecture,
-                    "created_at": image.created_at,
-                    "description": image.get("description"),
-                })
-            return images
+            conn = await self._connect()
+            images = await self._run(
+                list, conn.image.images(limit=self.CATALOG_PAGE_SIZE)
+            )
+            return [_image_to_dict(image) for image in images]
         except Exception as e:
-            logger.error(f"Failed to list images: {e}")
+            logger.error("Failed to list images: %s", e)
             raise OpenStackException(
                 message=f"Failed to list images: {str(e)}",
                 openstack_error=str(e),
             )
 
-    async def get_image(self, image_id: str) -> dict[str, Any]:
-        """Get image details from OpenStack."""
+    async def get_image(self, image_id: str) -> Mapping[str, Any]:
+        """Get image details from OpenStack (cached)."""
+        return await self._image_cache.get_or_set(
+            image_id, partial(self._fetch_image, image_id)
+        )
+
+    async def _fetch_image(self, image_id: str) -> Mapping[str, Any]:
+        """Fetch image details from OpenStack."""
         try:
-            conn = self._get_connection()
-            image = conn.image.find_image(image_id)
+            conn = await self._connect()
+            image = await self._run(conn.image.find_image, image_id)
             if image is None:
                 raise ResourceNotFoundException("Image", image_id)
-            return {
-                "id": image.id,
-                "name": image.name,
-                "status": image.status,
-                "size_bytes": image.size,
-                "min_disk_gb": image.min_disk,
-                "min_memory_mb": image.min_ram,
-                "os_distro": image.os_distro,
-                "os_version": image.os_version,
-                "architecture": image.architecture,
-                "created_at": image.created_at,
-                "description": image.get("description"),
-            }
+            return _image_to_dict(image)
         except ResourceNotFoundException:
             raise
         except Exception as e:
-            logger.error(f"Failed to get image {image_id}: {e}")
+            logger.error("Failed to get image %s: %s", image_id, e)
             raise OpenStackException(
                 message=f"Failed to get image: {str(e)}",
                 openstack_error=str(e),
@@ -647,17 +744,29 @@ class RealOpenStackClient(BaseOpenStackClient):
     async def check_connection(self) -> bool:
         """Check connection to OpenStack."""
         try:
-            conn = self._get_connection()
+            conn = await self._connect()
             # Try to list flavors as a simple connectivity check
-            list(conn.compute.flavors(limit=1))
+            await self._run(list, conn.compute.flavors(limit=1))
             return True
         except Exception as e:
-            logger.error(f"OpenStack connection check failed: {e}")
+            logger.error("OpenStack connection check failed: %s", e)
             return False
 
+    async def close(self) -> None:
+        """Close the SDK connection, its HTTP pool and the worker threads."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
+
+@lru_cache(maxsize=1)
 def get_openstack_client() -> BaseOpenStackClient:
-    """Factory function to get the appropriate OpenStack client."""
+    """Get the process-wide OpenStack client.
+
+    The client is built once so its SDK connection and auth token are
+    reused across requests.
+    """
     settings = get_settings()
 
     if settings.use_mock_openstack:
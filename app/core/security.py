@@ -1,11 +1,15 @@
 """Security utilities for API authentication."""
 
+import hashlib
+import secrets
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Security, status
+import orjson
+from fastapi import Depends, Security
 from fastapi.security import APIKeyHeader
 
-from app.config import get_settings
+from app.config import SettingsDep
 
 # API Key header definition
 api_key_header = APIKeyHeader(
@@ -15,6 +19,43 @@ api_key_header = APIKeyHeader(
 )
 
 
+class APIKeyError(Exception):
+    """Rejected API key; carries a pre-rendered 401 body."""
+
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+
+
+# Auth failures are raised often under bad clients, so the bodies are
+# rendered once (same shape as HTTPException's {"detail": ...}); bytes are
+# immutable, so nothing a handler does can leak into later responses
+_MISSING_KEY_BODY = orjson.dumps(
+    {
+        "detail": {
+            "error": "AUTHENTICATION_ERROR",
+            "message": "API key is required",
+            "details": "Provide API key in X-API-Key header",
+        }
+    }
+)
+_INVALID_KEY_BODY = orjson.dumps(
+    {
+        "detail": {
+            "error": "AUTHENTICATION_ERROR",
+            "message": "Invalid API key",
+            "details": "The provided API key is not valid",
+        }
+    }
+)
+
+
+@lru_cache(maxsize=8)
+def _key_digest(key: str) -> bytes:
+    """Return the SHA-256 digest of an API key (cached per configured key)."""
+    return hashlib.sha256(key.encode()).digest()
+
+
 def get_api_key_header() -> APIKeyHeader:
     """Return the API key header dependency."""
     return api_key_header
@@ -22,39 +63,27 @@ def get_api_key_header() -> APIKeyHeader:
 
 async def verify_api_key(
     api_key: Annotated[str | None, Security(api_key_header)],
+    settings: SettingsDep,
 ) -> str:
     """Verify the API key from request header.
 
     Args:
         api_key: API key from X-API-Key header
+        settings: Application settings
 
     Returns:
         The validated API key
 
     Raises:
-        HTTPException: If API key is missing or invalid
+        APIKeyError: If API key is missing or invalid
     """
-    settings = get_settings()
-
     if api_key is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": "AUTHENTICATION_ERROR",
-                "message": "API key is required",
-                "details": "Provide API key in X-API-Key header",
-            },
-        )
-
-    if api_key != settings.api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": "AUTHENTICATION_ERROR",
-                "message": "Invalid API key",
-                "details": "The provided API key is not valid",
-            },
-        )
+        raise APIKeyError(_MISSING_KEY_BODY)
+
+    # Compare fixed-length digests in constant time to avoid leaking the key
+    given = hashlib.sha256(api_key.encode()).digest()
+    if not secrets.compare_digest(given, _key_digest(settings.api_key)):
+        raise APIKeyError(_INVALID_KEY_BODY)
 
     return api_key
 
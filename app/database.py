@@ -2,23 +2,47 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 settings = get_settings()
 
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Build connection pool options for the configured database.
+
+    SQLite keeps SQLAlchemy's own pool choice (a single shared connection
+    for in-memory databases), so pool sizing only applies to server
+    databases such as PostgreSQL or MySQL.
+    """
+    if settings.database_url.startswith("sqlite"):
+        return {}
+    if settings.database_use_null_pool:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_use_lifo": settings.database_pool_use_lifo,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    future=True,
+    **_engine_options(settings),
 )
 
 # Create async session factory
@@ -39,10 +63,19 @@ class Base(DeclarativeBase):
 
 async def create_tables() -> None:
     """Create all database tables."""
+    # Register the models on Base.metadata; imported here to avoid a cycle
+    import app.models  # noqa: F401
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def check_connection() -> None:
+    """Verify the database is reachable by running a trivial query."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
 async def drop_tables() -> None:
     """Drop all database tables."""
     async with engine.begin() as conn:
@@ -2,25 +2,70 @@
 
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
-from fastapi import FastAPI, Request, status
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 
 from app.api.v1 import api_router
 from app.config import get_settings
+from app.core.clock import utc_iso_coarse
 from app.core.exceptions import APIException
-from app.database import create_tables
+from app.core.openstack_client import get_openstack_client
+from app.core.security import APIKeyError
+from app.database import check_connection, create_tables, engine
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=get_settings().log_level.upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+REDOC_URL = "/redoc"
+
+
+def get_openapi_bytes(app: FastAPI) -> bytes:
+    """Return the OpenAPI schema rendered to JSON bytes.
+
+    The schema is rendered on first use and kept on ``app.state`` so each
+    request only copies the buffer instead of re-serializing the dict.
+    """
+    content = getattr(app.state, "openapi_bytes", None)
+    if content is None:
+        content = orjson.dumps(app.openapi())
+        app.state.openapi_bytes = content
+    return content
+
+
+def add_docs_routes(app: FastAPI) -> None:
+    """Register the OpenAPI schema and docs pages as pre-rendered routes."""
+    swagger_html = get_swagger_ui_html(
+        openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI"
+    ).body
+    redoc_html = get_redoc_html(
+        openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc"
+    ).body
+
+    @app.get(OPENAPI_URL, include_in_schema=False)
+    async def openapi_schema() -> Response:
+        """Serve the OpenAPI schema."""
+        return Response(content=get_openapi_bytes(app), media_type="application/json")
+
+    @app.get(DOCS_URL, include_in_schema=False)
+    async def swagger_ui() -> Response:
+        """Serve the Swagger UI page."""
+        return Response(content=swagger_html, media_type="text/html")
+
+    @app.get(REDOC_URL, include_in_schema=False)
+    async def redoc() -> Response:
+        """Serve the ReDoc page."""
+        return Response(content=redoc_html, media_type="text/html")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -28,17 +73,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("Starting OpenStack VM Lifecycle API...")
 
-    # Create database tables
-    await create_tables()
-    logger.info("Database tables created/verified")
-
     settings = get_settings()
-    logger.info(f"Running in {'mock' if settings.use_mock_openstack else 'real'} OpenStack mode")
+
+    if settings.auto_create_tables:
+        await create_tables()
+        logger.info("Database tables created/verified")
+    else:
+        # Schema is managed out of band; just make sure the database is up
+        await check_connection()
+        logger.info("Database connection verified")
+
+    logger.info(
+        "Running in %s OpenStack mode",
+        "mock" if settings.use_mock_openstack else "real",
+    )
+
+    # Build the process-wide OpenStack client up front and expose it on state
+    app.state.openstack_client = get_openstack_client()
+
+    # Render the schema now so the first docs request doesn't pay for it
+    get_openapi_bytes(app)
 
     yield
 
     # Shutdown
     logger.info("Shutting down OpenStack VM Lifecycle API...")
+    await app.state.openstack_client.close()
 
 
 def create_application() -> FastAPI:
@@ -74,23 +134,26 @@ X-API-Key: your-api-key-here
 3. Create a VM: `POST /api/v1/vms`
 4. Manage VM lifecycle: start, stop, reboot
         """,
-        openapi_url="/openapi.json",
-        docs_url="/docs",
-        redoc_url="/redoc",
+        # Served from pre-rendered bytes by add_docs_routes()
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
         lifespan=lifespan,
     )
 
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
+        allow_origins=settings.cors_origins,  # Restrict in production
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=settings.cors_methods,
+        allow_headers=settings.cors_headers,
+        expose_headers=["ETag"],
     )
 
     # Include API router
     app.include_router(api_router, prefix="/api/v1")
+    add_docs_routes(app)
 
     return app
 
@@ -99,42 +162,82 @@ X-API-Key: your-api-key-here
 app = create_application()
 
 
+def _error_response(status_code: int, content: dict[str, Any]) -> Response:
+    """Render an error body with orjson."""
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @app.exception_handler(APIException)
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+async def api_exception_handler(request: Request, exc: APIException) -> Response:
     """Handle custom API exceptions."""
-    return JSONResponse(
+    return Response(
+        content=exc.render_body(utc_iso_coarse()),
         status_code=exc.status_code,
-        content={
-            "error": exc.error_code,
-            "message": exc.message,
-            "details": exc.details,
-            "timestamp": datetime.utcnow().isoformat(),
-        },
+        media_type="application/json",
+    )
+
+
+@app.exception_handler(APIKeyError)
+async def api_key_exception_handler(request: Request, exc: APIKeyError) -> Response:
+    """Handle rejected API keys with their pre-rendered 401 body."""
+    return Response(
+        content=exc.body,
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        media_type="application/json",
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions."""
-    logger.exception(f"Unexpected error: {exc}")
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
+    logger.exception("Unexpected error: %s", exc)
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {
             "error": "INTERNAL_SERVER_ERROR",
             "message": "An unexpected error occurred",
             "details": {"error": str(exc)} if get_settings().debug else {},
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_iso_coarse(),
         },
     )
 
 
+async def _provision_schema() -> None:
+    """Create the schema once and release the connections used for it."""
+    await create_tables()
+    await engine.dispose()
+
+
 if __name__ == "__main__":
+    import asyncio
+    import os
+    import sys
+
     import uvicorn
 
     settings = get_settings()
+    workers = settings.workers or os.cpu_count() or 1
+    # uvicorn refuses to combine reload with multiple workers
+    if settings.reload and workers > 1:
+        if settings.workers:
+            logger.warning("RELOAD is set; ignoring WORKERS=%d", settings.workers)
+        workers = 1
+    if workers > 1 and settings.auto_create_tables:
+        # Create tables here, once, instead of racing the DDL in every
+        # worker's lifespan; the workers inherit the flag and skip it
+        asyncio.run(_provision_schema())
+        os.environ["AUTO_CREATE_TABLES"] = "false"
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        workers=workers,
+        # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
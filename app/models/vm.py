@@ -5,7 +5,18 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, Integer, String, Text, func
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -43,33 +54,62 @@ class VMState(str, enum.Enum):
     SOFT_DELETED = "SOFT_DELETED"
 
     @classmethod
-    def active_states(cls) -> list["VMState"]:
+    def active_states(cls) -> frozenset["VMState"]:
         """Return states considered as 'running'."""
-        return [cls.ACTIVE, cls.RUNNING]
+        return _ACTIVE_STATES
 
     @classmethod
-    def stopped_states(cls) -> list["VMState"]:
+    def stopped_states(cls) -> frozenset["VMState"]:
         """Return states considered as 'stopped'."""
-        return [cls.STOPPED, cls.SHUTOFF]
+        return _STOPPED_STATES
 
     @classmethod
-    def transitional_states(cls) -> list["VMState"]:
+    def transitional_states(cls) -> frozenset["VMState"]:
         """Return transitional states."""
-        return [
-            cls.BUILDING,
-            cls.BUILD,
-            cls.REBOOT,
-            cls.HARD_REBOOT,
-            cls.RESIZE,
-            cls.VERIFY_RESIZE,
-            cls.MIGRATING,
-        ]
+        return _TRANSITIONAL_STATES
+
+
+# State groups, built once so membership checks are a single hash lookup
+_ACTIVE_STATES = frozenset({VMState.ACTIVE, VMState.RUNNING})
+_STOPPED_STATES = frozenset({VMState.STOPPED, VMState.SHUTOFF})
+_TRANSITIONAL_STATES = frozenset(
+    {
+        VMState.BUILDING,
+        VMState.BUILD,
+        VMState.REBOOT,
+        VMState.HARD_REBOOT,
+        VMState.RESIZE,
+        VMState.VERIFY_RESIZE,
+        VMState.MIGRATING,
+    }
+)
+_DELETED_STATES = frozenset({VMState.DELETED, VMState.SOFT_DELETED})
+
+# Predicate shared by the partial indexes below; mirrors the service filter
+_NOT_DELETED = text("state <> 'DELETED'")
 
 
 class VM(Base):
     """Virtual Machine database model."""
 
     __tablename__ = "vms"
+    __table_args__ = (
+        # Partial index matching the list query's "not deleted" predicate, so
+        # newest-first pages are read in index order without a sort
+        Index(
+            "ix_vms_active_created",
+            "created_at",
+            postgresql_where=_NOT_DELETED,
+            sqlite_where=_NOT_DELETED,
+        ),
+        # Trigram index so the substring name filter can avoid a full scan
+        Index(
+            "ix_vms_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Primary key - internal database ID
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -95,7 +135,16 @@ class VM(Base):
 
     # VM State
     state: Mapped[VMState] = mapped_column(
-        Enum(VMState),
+        # Plain VARCHAR + CHECK rather than a native ENUM type, so adding a
+        # state needs no type migration and the partial indexes stay on text
+        Enum(
+            VMState,
+            native_enum=False,
+            length=20,
+            values_callable=lambda states: [state.value for state in states],
+            create_constraint=True,
+            name="ck_vms_state",
+        ),
         nullable=False,
         default=VMState.BUILDING,
         index=True,
@@ -142,34 +191,42 @@ class VM(Base):
     @property
     def is_running(self) -> bool:
         """Check if VM is in a running state."""
-        return self.state in VMState.active_states()
+        return self.state in _ACTIVE_STATES
 
     @property
     def is_stopped(self) -> bool:
         """Check if VM is in a stopped state."""
-        return self.state in VMState.stopped_states()
+        return self.state in _STOPPED_STATES
 
     @property
     def is_transitioning(self) -> bool:
         """Check if VM is in a transitional state."""
-        return self.state in VMState.transitional_states()
+        return self.state in _TRANSITIONAL_STATES
 
     @property
     def can_start(self) -> bool:
         """Check if VM can be started."""
-        return self.state in VMState.stopped_states()
+        return self.state in _STOPPED_STATES
 
     @property
     def can_stop(self) -> bool:
         """Check if VM can be stopped."""
-        return self.state in VMState.active_states()
+        return self.state in _ACTIVE_STATES
 
     @property
     def can_reboot(self) -> bool:
         """Check if VM can be rebooted."""
-        return self.state in VMState.active_states()
+        return self.state in _ACTIVE_STATES
 
     @property
     def can_delete(self) -> bool:
         """Check if VM can be deleted."""
-        return self.state not in [VMState.DELETED, VMState.SOFT_DELETED]
+        return self.state not in _DELETED_STATES
+
+
+# gin_trgm_ops comes from pg_trgm, which must exist before the index
+event.listen(
+    VM.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -6,6 +6,10 @@ from app.schemas.vm import (
     VMResponse,
     VMListResponse,
     VMActionResponse,
+    VMBulkAction,
+    VMBulkActionRequest,
+    VMBulkActionResponse,
+    VMBulkSyncRequest,
     RebootType,
     PaginationParams,
 )
@@ -22,6 +26,10 @@ __all__ = [
     "VMResponse",
     "VMListResponse",
     "VMActionResponse",
+    "VMBulkAction",
+    "VMBulkActionRequest",
+    "VMBulkActionResponse",
+    "VMBulkSyncRequest",
     "RebootType",
     "PaginationParams",
     "HealthResponse",
@@ -1,6 +1,6 @@
 """Common Pydantic schemas for API responses."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
@@ -12,7 +12,8 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Service status", examples=["healthy"])
     version: str = Field(..., description="API version", examples=["1.0.0"])
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Response timestamp",
     )
     database: str = Field(
         ..., description="Database connection status", examples=["connected"]
@@ -44,7 +45,8 @@ class ErrorResponse(BaseModel):
         default=None, description="Request ID for tracking"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Error timestamp"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Error timestamp",
     )
 
 
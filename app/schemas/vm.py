@@ -1,7 +1,7 @@
 """Pydantic schemas for VM operations."""
 
 import enum
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -178,7 +178,8 @@ class VMActionResponse(BaseModel):
     )
     current_state: VMState = Field(..., description="Current state after action")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Action timestamp"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Action timestamp",
     )
 
 
@@ -191,6 +192,64 @@ class VMRebootRequest(BaseModel):
     )
 
 
+class VMBulkAction(str, enum.Enum):
+    """Actions that can be applied to several VMs at once."""
+
+    START = "start"
+    STOP = "stop"
+    REBOOT = "reboot"
+
+
+class VMBulkActionRequest(BaseModel):
+    """Schema for a bulk VM action request."""
+
+    action: VMBulkAction = Field(..., description="Action to perform")
+    vm_uuids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="UUIDs of the VMs to act on",
+    )
+    reboot_type: RebootType = Field(
+        default=RebootType.SOFT,
+        description="Type of reboot (only used for the reboot action)",
+    )
+
+
+class VMBulkSyncRequest(BaseModel):
+    """Schema for a bulk VM state sync request."""
+
+    vm_uuids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="UUIDs of the VMs to sync",
+    )
+
+
+class VMBulkActionResult(BaseModel):
+    """Outcome of a bulk action for a single VM."""
+
+    vm_uuid: str = Field(..., description="VM UUID")
+    status: str = Field(..., description="Action status (success or failed)")
+    message: str = Field(..., description="Status message")
+    previous_state: Optional[VMState] = Field(
+        default=None, description="State before action"
+    )
+    current_state: Optional[VMState] = Field(
+        default=None, description="Current state after action"
+    )
+
+
+class VMBulkActionResponse(BaseModel):
+    """Schema for bulk VM action response."""
+
+    action: str = Field(..., description="Action performed")
+    succeeded: int = Field(..., description="Number of VMs the action succeeded on")
+    failed: int = Field(..., description="Number of VMs the action failed on")
+    results: list[VMBulkActionResult] = Field(..., description="Per-VM results")
+
+
 class VMResizeRequest(BaseModel):
     """Schema for VM resize request."""
 
@@ -1,11 +1,13 @@
 """VM service layer containing business logic."""
 
+import asyncio
 import logging
-from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.exceptions import VMNotFoundException, VMStateException
 from app.core.openstack_client import BaseOpenStackClient, get_openstack_client
@@ -17,11 +19,115 @@ from app.schemas.vm import (
     VMResponse,
     VMListResponse,
     VMActionResponse,
+    VMBulkAction,
+    VMBulkActionResponse,
+    VMBulkActionResult,
     RebootType,
 )
 
 logger = logging.getLogger(__name__)
 
+# OpenStack server status -> VMState; unknown statuses map to ERROR
+_OS_STATUS_MAPPING = MappingProxyType(
+    {
+        "ACTIVE": VMState.ACTIVE,
+        "SHUTOFF": VMState.SHUTOFF,
+        "BUILDING": VMState.BUILDING,
+        "ERROR": VMState.ERROR,
+        "PAUSED": VMState.PAUSED,
+        "SUSPENDED": VMState.SUSPENDED,
+        "REBOOT": VMState.REBOOT,
+        "HARD_REBOOT": VMState.HARD_REBOOT,
+        "RESIZE": VMState.RESIZE,
+        "VERIFY_RESIZE": VMState.VERIFY_RESIZE,
+        "DELETED": VMState.DELETED,
+        "SOFT_DELETED": VMState.SOFT_DELETED,
+    }
+)
+
+# Columns surfaced by VMResponse; anything else raises rather than lazy-loads
+_LIST_COLUMNS = load_only(
+    VM.uuid,
+    VM.name,
+    VM.state,
+    VM.state_description,
+    VM.flavor_id,
+    VM.image_id,
+    VM.vcpus,
+    VM.memory_mb,
+    VM.disk_gb,
+    VM.ip_address,
+    VM.floating_ip,
+    VM.description,
+    VM.key_name,
+    VM.openstack_id,
+    VM.created_at,
+    VM.updated_at,
+    VM.launched_at,
+    VM.terminated_at,
+    raiseload=True,
+)
+
+# Built once; the statement (and its compiled form) is reused per lookup
+_VM_BY_UUID = select(VM).where(
+    VM.uuid == bindparam("vm_uuid"),
+    VM.state != VMState.DELETED,
+)
+
+# (is_running, is_stopped, is_transitioning) per state, so building a
+# response costs one dict lookup instead of three property calls
+_STATE_FLAGS: dict[VMState, tuple[bool, bool, bool]] = {
+    state: (
+        state in VMState.active_states(),
+        state in VMState.stopped_states(),
+        state in VMState.transitional_states(),
+    )
+    for state in VMState
+}
+
+
+def _contains_pattern(value: str) -> str:
+    """Build a LIKE pattern matching value as a literal substring.
+
+    The pattern is bound as a single parameter rather than concatenated
+    in SQL, which lets PostgreSQL plan it against the trigram index.
+    """
+    escaped = value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
+
+
+def _vm_to_response_fast(vm: VM) -> VMResponse:
+    """Build a VMResponse from a trusted ORM row without re-validating it.
+
+    Used on the list path, where every field comes straight from the
+    database and full validation per row is wasted work.
+    """
+    state = vm.state
+    is_running, is_stopped, is_transitioning = _STATE_FLAGS[state]
+    return VMResponse.model_construct(
+        uuid=vm.uuid,
+        name=vm.name,
+        state=state,
+        state_description=vm.state_description,
+        flavor_id=vm.flavor_id,
+        image_id=vm.image_id,
+        vcpus=vm.vcpus,
+        memory_mb=vm.memory_mb,
+        disk_gb=vm.disk_gb,
+        ip_address=vm.ip_address,
+        floating_ip=vm.floating_ip,
+        description=vm.description,
+        key_name=vm.key_name,
+        openstack_id=vm.openstack_id,
+        created_at=vm.created_at,
+        updated_at=vm.updated_at,
+        launched_at=vm.launched_at,
+        terminated_at=vm.terminated_at,
+        is_running=is_running,
+        is_stopped=is_stopped,
+        is_transitioning=is_transitioning,
+    )
+
 
 class VMService:
     """Service class for VM lifecycle operations."""
@@ -49,9 +155,12 @@ class VMService:
         Returns:
             Created VM details
         """
-        # Validate flavor and image exist
-        flavor = await self.openstack.get_flavor(vm_data.flavor_id)
-        await self.openstack.get_image(vm_data.image_id)
+        # Validate flavor and image exist; the lookups are independent, and
+        # the real client answers both from its catalog cache when warm
+        flavor, _ = await asyncio.gather(
+            self.openstack.get_flavor(vm_data.flavor_id),
+            self.openstack.get_image(vm_data.image_id),
+        )
 
         # Create VM in database first (in BUILDING state)
         vm = VM(
@@ -67,7 +176,9 @@ class VMService:
             disk_gb=flavor.get("disk_gb"),
         )
         self.session.add(vm)
-        await self.session.flush()
+        # Commit the BUILDING row up front so no transaction (or pooled
+        # connection) is held open across the OpenStack call
+        await self.session.commit()
 
         try:
             # Create VM in OpenStack
@@ -82,26 +193,30 @@ class VMService:
                 availability_zone=vm_data.availability_zone,
                 metadata=vm_data.metadata,
             )
-
-            # Update VM with OpenStack details
-            vm.openstack_id = os_server["id"]
-            vm.state = VMState.ACTIVE
-            vm.ip_address = os_server.get("ip_address")
-            vm.floating_ip = os_server.get("floating_ip")
-            vm.launched_at = datetime.utcnow()
-
-            logger.info(f"Created VM {vm.uuid} ({vm.name})")
-
-        except Exception as e:
-            # Mark VM as error state if OpenStack creation fails
+        except (Exception, asyncio.CancelledError) as e:
+            # Mark VM as error state if OpenStack creation fails or the
+            # request is cancelled mid-call (client disconnect, timeout);
+            # the BUILDING row is already committed and would be stranded.
+            # Shielded so a repeated cancellation can't interrupt the write.
             vm.state = VMState.ERROR
-            vm.state_description = str(e)
-            logger.error(f"Failed to create VM in OpenStack: {e}")
+            vm.state_description = str(e) or type(e).__name__
+            await asyncio.shield(self.session.commit())
+            logger.error("Failed to create VM in OpenStack: %s", vm.state_description)
             raise
 
+        # Update VM with OpenStack details in a second, short transaction
+        vm.openstack_id = os_server["id"]
+        vm.state = VMState.ACTIVE
+        vm.ip_address = os_server.get("ip_address")
+        vm.floating_ip = os_server.get("floating_ip")
+        # Filled in by the database, like created_at/updated_at
+        vm.launched_at = func.now()
+
         await self.session.commit()
         await self.session.refresh(vm)
 
+        logger.info("Created VM %s (%s)", vm.uuid, vm.name)
+
         return VMResponse.model_validate(vm)
 
     async def get_vm(self, vm_uuid: str) -> VMResponse:
@@ -135,34 +250,42 @@ class VMService:
         Returns:
             Paginated list of VMs
         """
-        # Build query
-        query = select(VM).where(VM.state != VMState.DELETED)
+        # Build query; user_data is never listed, so leave it on the server
+        query = select(VM).options(_LIST_COLUMNS).where(VM.state != VMState.DELETED)
 
         if state:
             query = query.where(VM.state == state)
 
         if name_filter:
-            query = query.where(VM.name.ilike(f"%{name_filter}%"))
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.session.scalar(count_query) or 0
+            query = query.where(
+                VM.name.ilike(_contains_pattern(name_filter), escape="/")
+            )
 
-        # Apply pagination
-        query = (
-            query.order_by(VM.created_at.desc())
+        # Count rides along on every row, so one round-trip serves the page
+        page_query = (
+            query.add_columns(func.count().over().label("total"))
+            .order_by(VM.created_at.desc())
             .offset(pagination.offset)
             .limit(pagination.page_size)
         )
 
-        result = await self.session.execute(query)
-        vms = result.scalars().all()
+        rows = (await self.session.execute(page_query)).all()
+        vms = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif pagination.offset:
+            # Past the last page there are no rows to carry the total
+            count_query = select(func.count()).select_from(query.subquery())
+            total = await self.session.scalar(count_query) or 0
+        else:
+            total = 0
 
         # Calculate total pages
         pages = (total + pagination.page_size - 1) // pagination.page_size
 
-        return VMListResponse(
-            items=[VMResponse.model_validate(vm) for vm in vms],
+        return VMListResponse.model_construct(
+            items=[_vm_to_response_fast(vm) for vm in vms],
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -190,7 +313,7 @@ class VMService:
         await self.session.commit()
         await self.session.refresh(vm)
 
-        logger.info(f"Updated VM {vm.uuid}")
+        logger.info("Updated VM %s", vm.uuid)
         return VMResponse.model_validate(vm)
 
     async def delete_vm(self, vm_uuid: str) -> VMActionResponse:
@@ -217,15 +340,15 @@ class VMService:
             try:
                 await self.openstack.delete_server(vm.openstack_id)
             except Exception as e:
-                logger.warning(f"Failed to delete VM from OpenStack: {e}")
+                logger.warning("Failed to delete VM from OpenStack: %s", e)
                 # Continue with local deletion even if OpenStack fails
 
         # Mark as deleted
         vm.state = VMState.DELETED
-        vm.terminated_at = datetime.utcnow()
+        vm.terminated_at = func.now()
 
         await self.session.commit()
-        logger.info(f"Deleted VM {vm.uuid}")
+        logger.info("Deleted VM %s", vm.uuid)
 
         return VMActionResponse(
             vm_uuid=vm_uuid,
@@ -263,7 +386,7 @@ class VMService:
         vm.state = VMState.ACTIVE
         await self.session.commit()
 
-        logger.info(f"Started VM {vm.uuid}")
+        logger.info("Started VM %s", vm.uuid)
 
         return VMActionResponse(
             vm_uuid=vm_uuid,
@@ -301,7 +424,7 @@ class VMService:
         vm.state = VMState.SHUTOFF
         await self.session.commit()
 
-        logger.info(f"Stopped VM {vm.uuid}")
+        logger.info("Stopped VM %s", vm.uuid)
 
         return VMActionResponse(
             vm_uuid=vm_uuid,
@@ -335,19 +458,15 @@ class VMService:
                 message=f"VM must be running to reboot (current: {vm.state.value})",
             )
 
-        # Set transitional state
-        vm.state = VMState.REBOOT if reboot_type == RebootType.SOFT else VMState.HARD_REBOOT
-        await self.session.commit()
-
-        # Reboot in OpenStack
+        # Reboot in OpenStack. The call returns once the reboot is accepted,
+        # so the REBOOT/HARD_REBOOT state is never persisted on its own
         if vm.openstack_id:
             await self.openstack.reboot_server(vm.openstack_id, reboot_type.value)
 
-        # Set back to active
         vm.state = VMState.ACTIVE
         await self.session.commit()
 
-        logger.info(f"Rebooted VM {vm.uuid} ({reboot_type.value})")
+        logger.info("Rebooted VM %s (%s)", vm.uuid, reboot_type.value)
 
         return VMActionResponse(
             vm_uuid=vm_uuid,
@@ -358,6 +477,144 @@ class VMService:
             current_state=vm.state,
         )
 
+    async def bulk_action(
+        self,
+        action: VMBulkAction,
+        vm_uuids: list[str],
+        reboot_type: RebootType = RebootType.SOFT,
+    ) -> VMBulkActionResponse:
+        """Apply the same lifecycle action to several VMs.
+
+        All VMs are loaded with one query, the OpenStack calls run
+        concurrently and the new state is written with a single UPDATE.
+        VMs that are missing, in the wrong state or rejected by OpenStack
+        are reported as failed instead of aborting the whole batch.
+
+        Args:
+            action: Action to perform
+            vm_uuids: UUIDs of the VMs to act on
+            reboot_type: SOFT or HARD reboot (reboot action only)
+
+        Returns:
+            Per-VM action results
+        """
+        uuids = list(dict.fromkeys(vm_uuids))
+
+        query = select(VM).where(
+            VM.uuid.in_(uuids),
+            VM.state != VMState.DELETED,
+        )
+        result = await self.session.execute(query)
+        vms = {vm.uuid: vm for vm in result.scalars()}
+
+        if action == VMBulkAction.START:
+            allowed_states, target_state, done = (
+                VMState.stopped_states(),
+                VMState.ACTIVE,
+                "started",
+            )
+        elif action == VMBulkAction.STOP:
+            allowed_states, target_state, done = (
+                VMState.active_states(),
+                VMState.SHUTOFF,
+                "stopped",
+            )
+        else:
+            allowed_states, target_state, done = (
+                VMState.active_states(),
+                VMState.ACTIVE,
+                "rebooted",
+            )
+
+        results: dict[str, VMBulkActionResult] = {}
+        eligible: list[VM] = []
+        for vm_uuid in uuids:
+            vm = vms.get(vm_uuid)
+            if vm is None:
+                results[vm_uuid] = VMBulkActionResult(
+                    vm_uuid=vm_uuid,
+                    status="failed",
+                    message=f"VM with ID '{vm_uuid}' not found",
+                )
+            elif vm.state not in allowed_states:
+                results[vm_uuid] = VMBulkActionResult(
+                    vm_uuid=vm_uuid,
+                    status="failed",
+                    message=f"Cannot {action.value} VM in state {vm.state.value}",
+                    previous_state=vm.state,
+                    current_state=vm.state,
+                )
+            else:
+                eligible.append(vm)
+
+        outcomes = await asyncio.gather(
+            *(self._apply_openstack_action(action, vm, reboot_type) for vm in eligible),
+            return_exceptions=True,
+        )
+
+        succeeded: list[str] = []
+        for vm, outcome in zip(eligible, outcomes, strict=True):
+            # BaseException: a cancelled call comes back as CancelledError
+            if isinstance(outcome, BaseException):
+                message = str(outcome) or type(outcome).__name__
+                logger.error("Failed to %s VM %s: %s", action.value, vm.uuid, message)
+                results[vm.uuid] = VMBulkActionResult(
+                    vm_uuid=vm.uuid,
+                    status="failed",
+                    message=message,
+                    previous_state=vm.state,
+                    current_state=vm.state,
+                )
+            else:
+                succeeded.append(vm.uuid)
+                results[vm.uuid] = VMBulkActionResult(
+                    vm_uuid=vm.uuid,
+                    status="success",
+                    message=f"VM {vm.name} has been {done}",
+                    previous_state=vm.state,
+                    current_state=target_state,
+                )
+
+        if succeeded:
+            await self.session.execute(
+                update(VM).where(VM.uuid.in_(succeeded)).values(state=target_state)
+            )
+            await self.session.commit()
+
+        logger.info(
+            "Bulk %s: %d succeeded, %d failed",
+            action.value,
+            len(succeeded),
+            len(uuids) - len(succeeded),
+        )
+
+        return VMBulkActionResponse(
+            action=action.value,
+            succeeded=len(succeeded),
+            failed=len(uuids) - len(succeeded),
+            results=[results[vm_uuid] for vm_uuid in uuids],
+        )
+
+    async def _apply_openstack_action(
+        self, action: VMBulkAction, vm: VM, reboot_type: RebootType
+    ) -> None:
+        """Issue the OpenStack call for one VM of a bulk action.
+
+        Args:
+            action: Action to perform
+            vm: VM model instance
+            reboot_type: SOFT or HARD reboot (reboot action only)
+        """
+        if not vm.openstack_id:
+            return
+
+        if action == VMBulkAction.START:
+            await self.openstack.start_server(vm.openstack_id)
+        elif action == VMBulkAction.STOP:
+            await self.openstack.stop_server(vm.openstack_id)
+        else:
+            await self.openstack.reboot_server(vm.openstack_id, reboot_type.value)
+
     async def sync_vm_state(self, vm_uuid: str) -> VMResponse:
         """Sync VM state from OpenStack.
 
@@ -370,30 +627,14 @@ class VMService:
         vm = await self._get_vm_by_uuid(vm_uuid)
 
         if not vm.openstack_id:
-            logger.warning(f"VM {vm_uuid} has no OpenStack ID, cannot sync")
+            logger.warning("VM %s has no OpenStack ID, cannot sync", vm_uuid)
             return VMResponse.model_validate(vm)
 
         try:
             os_server = await self.openstack.get_server(vm.openstack_id)
 
-            # Map OpenStack status to VMState
-            status_mapping = {
-                "ACTIVE": VMState.ACTIVE,
-                "SHUTOFF": VMState.SHUTOFF,
-                "BUILDING": VMState.BUILDING,
-                "ERROR": VMState.ERROR,
-                "PAUSED": VMState.PAUSED,
-                "SUSPENDED": VMState.SUSPENDED,
-                "REBOOT": VMState.REBOOT,
-                "HARD_REBOOT": VMState.HARD_REBOOT,
-                "RESIZE": VMState.RESIZE,
-                "VERIFY_RESIZE": VMState.VERIFY_RESIZE,
-                "DELETED": VMState.DELETED,
-                "SOFT_DELETED": VMState.SOFT_DELETED,
-            }
-
             os_status = os_server.get("status", "").upper()
-            new_state = status_mapping.get(os_status, VMState.ERROR)
+            new_state = _OS_STATUS_MAPPING.get(os_status, VMState.ERROR)
 
             vm.state = new_state
             vm.ip_address = os_server.get("ip_address")
@@ -402,14 +643,111 @@ class VMService:
             await self.session.commit()
             await self.session.refresh(vm)
 
-            logger.info(f"Synced VM {vm_uuid} state: {new_state.value}")
+            logger.info("Synced VM %s state: %s", vm_uuid, new_state.value)
 
         except Exception as e:
-            logger.error(f"Failed to sync VM {vm_uuid} state: {e}")
+            logger.error("Failed to sync VM %s state: %s", vm_uuid, e)
             raise
 
         return VMResponse.model_validate(vm)
 
+    async def sync_vm_states(self, vm_uuids: list[str]) -> VMBulkActionResponse:
+        """Sync the state of several VMs from OpenStack.
+
+        The VMs are loaded with one query, their servers are fetched
+        concurrently and all rows are written back in one executemany UPDATE.
+
+        Args:
+            vm_uuids: UUIDs of the VMs to sync
+
+        Returns:
+            Per-VM sync results
+        """
+        uuids = list(dict.fromkeys(vm_uuids))
+
+        query = select(VM.id, VM.uuid, VM.openstack_id, VM.state).where(
+            VM.uuid.in_(uuids),
+            VM.state != VMState.DELETED,
+        )
+        rows = {row.uuid: row for row in await self.session.execute(query)}
+
+        results: dict[str, VMBulkActionResult] = {}
+        linked = []
+        for vm_uuid in uuids:
+            row = rows.get(vm_uuid)
+            if row is None:
+                results[vm_uuid] = VMBulkActionResult(
+                    vm_uuid=vm_uuid,
+                    status="failed",
+                    message=f"VM with ID '{vm_uuid}' not found",
+                )
+            elif not row.openstack_id:
+                results[vm_uuid] = VMBulkActionResult(
+                    vm_uuid=vm_uuid,
+                    status="failed",
+                    message="VM has no OpenStack ID, cannot sync",
+                    previous_state=row.state,
+                    current_state=row.state,
+                )
+            else:
+                linked.append(row)
+
+        servers = await asyncio.gather(
+            *(self.openstack.get_server(row.openstack_id) for row in linked),
+            return_exceptions=True,
+        )
+
+        payload = []
+        for row, server in zip(linked, servers, strict=True):
+            # BaseException: a cancelled call comes back as CancelledError
+            if isinstance(server, BaseException):
+                message = str(server) or type(server).__name__
+                logger.error("Failed to sync VM %s state: %s", row.uuid, message)
+                results[row.uuid] = VMBulkActionResult(
+                    vm_uuid=row.uuid,
+                    status="failed",
+                    message=message,
+                    previous_state=row.state,
+                    current_state=row.state,
+                )
+                continue
+
+            os_status = server.get("status", "").upper()
+            new_state = _OS_STATUS_MAPPING.get(os_status, VMState.ERROR)
+            payload.append(
+                {
+                    "id": row.id,
+                    "state": new_state,
+                    "ip_address": server.get("ip_address"),
+                    "floating_ip": server.get("floating_ip"),
+                }
+            )
+            results[row.uuid] = VMBulkActionResult(
+                vm_uuid=row.uuid,
+                status="success",
+                message=f"VM state synced: {new_state.value}",
+                previous_state=row.state,
+                current_state=new_state,
+            )
+
+        if payload:
+            # executemany UPDATE keyed on primary key
+            await self.session.execute(update(VM), payload)
+            await self.session.commit()
+
+        logger.info(
+            "Bulk sync: %d succeeded, %d failed",
+            len(payload),
+            len(uuids) - len(payload),
+        )
+
+        return VMBulkActionResponse(
+            action="sync",
+            succeeded=len(payload),
+            failed=len(uuids) - len(payload),
+            results=[results[vm_uuid] for vm_uuid in uuids],
+        )
+
     async def _get_vm_by_uuid(self, vm_uuid: str) -> VM:
         """Get VM by UUID from database.
 
@@ -422,11 +760,7 @@ class VMService:
         Raises:
             VMNotFoundException: If VM not found
         """
-        query = select(VM).where(
-            VM.uuid == vm_uuid,
-            VM.state != VMState.DELETED,
-        )
-        result = await self.session.execute(query)
+        result = await self.session.execute(_VM_BY_UUID, {"vm_uuid": vm_uuid})
         vm = result.scalar_one_or_none()
 
         if vm is None:
@@ -0,0 +1,28 @@
+"""Shared assertion helpers for API tests."""
+
+from typing import Any
+
+
+def assert_vm_shape(
+    data: dict[str, Any],
+    *,
+    name: str,
+    flavor_id: str,
+    image_id: str,
+    state: str = "ACTIVE",
+) -> None:
+    """Assert that a VM response body has the expected fields.
+
+    Args:
+        data: Parsed VM response body
+        name: Expected VM name
+        flavor_id: Expected flavor ID
+        image_id: Expected image ID
+        state: Expected VM state
+    """
+    assert data["name"] == name
+    assert data["flavor_id"] == flavor_id
+    assert data["image_id"] == image_id
+    assert data["state"] == state
+    assert "uuid" in data
+    assert "created_at" in data
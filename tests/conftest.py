@@ -1,32 +1,46 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Any
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.deps import get_client
 from app.config import Settings, get_settings
+from app.core.openstack_client import MockOpenStackClient
 from app.database import Base, get_session
 from app.main import app
+from app.models.vm import VM, VMState
+
+# Give the shared assertion helpers pytest's detailed failure messages
+pytest.register_assert_rewrite("tests._asserts")
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop has no Windows build
+    uvloop = None
 
-# Set test environment variables before importing app modules
-os.environ["USE_MOCK_OPENSTACK"] = "true"
-os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
-os.environ["API_KEY"] = "test-api-key"
-os.environ["DEBUG"] = "true"
+TEST_API_KEY = "test-api-key"
 
 
+@lru_cache(maxsize=1)
 def get_test_settings() -> Settings:
-    """Get test settings override."""
+    """Get test settings override (built once, like get_settings)."""
     return Settings(
         use_mock_openstack=True,
         database_url="sqlite+aiosqlite:///:memory:",
-        api_key="test-api-key",
+        api_key=TEST_API_KEY,
         debug=True,
     )
 
@@ -35,31 +49,59 @@ def get_test_settings() -> Settings:
 app.dependency_overrides[get_settings] = get_test_settings
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --uvloop option."""
+    parser.addoption(
+        "--uvloop",
+        action="store_true",
+        default=False,
+        help="Run async tests on uvloop, as the server does in production",
+    )
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_db() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
-    """Create test database with fresh tables for each test."""
-    # Create in-memory database
+def pytest_configure(config: pytest.Config) -> None:
+    """Install the uvloop policy when --uvloop is given."""
+    if config.getoption("uvloop") and uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test on the session loop shared with test_engine."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the in-memory test database once per session."""
+    # StaticPool pins one connection, so every session sees the same
+    # in-memory database and its schema
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
-        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db(
+    test_engine: AsyncEngine,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Provide a session factory on the shared engine, emptied after each test."""
     # Create session factory
     session_factory = async_sessionmaker(
-        engine,
+        test_engine,
         class_=AsyncSession,
         expire_on_commit=False,
         autocommit=False,
@@ -68,52 +110,85 @@ async def test_db() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
 
     yield session_factory
 
-    # Cleanup
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-    await engine.dispose()
+    # Cleanup: clearing rows is far cheaper than dropping and recreating
+    async with test_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
 
 @pytest_asyncio.fixture(scope="function")
 async def db_session(
     test_db: async_sessionmaker[AsyncSession],
 ) -> AsyncGenerator[AsyncSession, None]:
-    """Get database session for tests."""
+    """Get database session for tests.
+
+    Closing the session releases its connection and discards any open
+    transaction; test_db then clears the tables.
+    """
     async with test_db() as session:
         yield session
-        await session.rollback()
+
+
+@pytest.fixture(scope="session")
+def _transport() -> ASGITransport:
+    """Create one ASGI transport for the whole session."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _http_client(_transport: ASGITransport) -> AsyncGenerator[AsyncClient, None]:
+    """Create one authenticated HTTP client for the whole session."""
+    async with AsyncClient(
+        transport=_transport,
+        base_url="http://test",
+        headers={"X-API-Key": TEST_API_KEY},
+    ) as ac:
+        yield ac
 
 
 @pytest_asyncio.fixture(scope="function")
 async def client(
+    _http_client: AsyncClient,
     test_db: async_sessionmaker[AsyncSession],
 ) -> AsyncGenerator[AsyncClient, None]:
-    """Create async test client."""
-    
+    """Point the shared test client at this test's database and a mock cloud."""
+
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
         async with test_db() as session:
             yield session
 
+    # One mock per test, never the client built from the environment/.env
+    openstack_client = MockOpenStackClient()
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_client] = lambda: openstack_client
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield _http_client
 
     # Clean up overrides
     app.dependency_overrides.pop(get_session, None)
+    app.dependency_overrides.pop(get_client, None)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def unauth_client(
+    _transport: ASGITransport,
+    client: AsyncClient,
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create a test client that sends no API key."""
+    async with AsyncClient(transport=_transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
 def api_key_header() -> dict[str, str]:
-    """Get API key header for authenticated requests."""
-    return {"X-API-Key": "test-api-key"}
+    """Get API key header for clients built without the default one."""
+    return {"X-API-Key": TEST_API_KEY}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_vm_data() -> dict[str, Any]:
-    """Sample VM creation data."""
+    """Sample VM creation data, shared read-only across a module."""
     return {
         "name": "test-vm",
         "flavor_id": "m1.small",
@@ -122,9 +197,34 @@ def sample_vm_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
+async def created_vm(
+    client: AsyncClient,
+    sample_vm_data: dict[str, Any],
+) -> dict[str, Any]:
+    """Create a VM through the API and return its response body."""
+    response = await client.post("/api/v1/vms", json=sample_vm_data)
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest_asyncio.fixture
+async def stopped_vm_uuid(db_session: AsyncSession) -> str:
+    """Insert a SHUTOFF VM straight into the database and return its UUID."""
+    vm = VM(
+        name="stopped-vm",
+        flavor_id="m1.small",
+        image_id="ubuntu-22.04",
+        state=VMState.SHUTOFF,
+    )
+    db_session.add(vm)
+    await db_session.commit()
+    return vm.uuid
+
+
+@pytest.fixture(scope="module")
 def sample_vm_data_full() -> dict[str, Any]:
-    """Full sample VM creation data with all optional fields."""
+    """Full sample VM creation data with all optional fields (read-only)."""
     return {
         "name": "test-vm-full",
         "flavor_id": "m1.medium",
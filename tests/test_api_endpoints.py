@@ -1,9 +1,19 @@
 """API endpoint integration tests."""
 
+import asyncio
 from typing import Any
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1.deps import get_client
+from app.core.exceptions import OpenStackException
+from app.core.openstack_client import MockOpenStackClient
+from app.main import app
+from app.schemas.vm import VMCreate
+from app.services.vm_service import VMService
+from tests._asserts import assert_vm_shape
 
 
 class TestHealthEndpoints:
@@ -32,36 +42,48 @@ class TestHealthEndpoints:
         assert "version" in data
         assert "docs" in data
 
+    @pytest.mark.asyncio
+    async def test_openapi_schema(self, client: AsyncClient) -> None:
+        """Test the OpenAPI schema and docs pages are served."""
+        response = await client.get("/openapi.json")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert "/api/v1/vms" in response.json()["paths"]
+
+        docs_response = await client.get("/docs")
+        assert docs_response.status_code == 200
+        assert "/openapi.json" in docs_response.text
+
 
 class TestAuthenticationEndpoints:
     """Tests for API authentication."""
 
     @pytest.mark.asyncio
-    async def test_missing_api_key(self, client: AsyncClient) -> None:
+    async def test_missing_api_key(self, unauth_client: AsyncClient) -> None:
         """Test request without API key."""
-        response = await client.get("/api/v1/vms")
+        response = await unauth_client.get("/api/v1/vms")
         assert response.status_code == 401
 
         data = response.json()
         assert data["detail"]["error"] == "AUTHENTICATION_ERROR"
 
     @pytest.mark.asyncio
-    async def test_invalid_api_key(self, client: AsyncClient) -> None:
+    async def test_invalid_api_key(self, unauth_client: AsyncClient) -> None:
         """Test request with invalid API key."""
-        response = await client.get(
+        response = await unauth_client.get(
             "/api/v1/vms",
             headers={"X-API-Key": "wrong-key"},
         )
         assert response.status_code == 401
+        assert response.json()["detail"]["message"] == "Invalid API key"
 
     @pytest.mark.asyncio
     async def test_valid_api_key(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test request with valid API key."""
-        response = await client.get("/api/v1/vms", headers=api_key_header)
+        response = await client.get("/api/v1/vms")
         assert response.status_code == 200
 
 
@@ -72,10 +94,9 @@ class TestVMEndpoints:
     async def test_list_vms_empty(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test listing VMs when none exist."""
-        response = await client.get("/api/v1/vms", headers=api_key_header)
+        response = await client.get("/api/v1/vms")
         assert response.status_code == 200
 
         data = response.json()
@@ -87,35 +108,30 @@ class TestVMEndpoints:
     async def test_create_vm(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
         sample_vm_data: dict[str, Any],
     ) -> None:
         """Test creating a new VM."""
         response = await client.post(
             "/api/v1/vms",
-            headers=api_key_header,
             json=sample_vm_data,
         )
         assert response.status_code == 201
 
-        data = response.json()
-        assert data["name"] == sample_vm_data["name"]
-        assert data["flavor_id"] == sample_vm_data["flavor_id"]
-        assert data["image_id"] == sample_vm_data["image_id"]
-        assert data["state"] == "ACTIVE"
-        assert "uuid" in data
-        assert "created_at" in data
+        assert_vm_shape(
+            response.json(),
+            name=sample_vm_data["name"],
+            flavor_id=sample_vm_data["flavor_id"],
+            image_id=sample_vm_data["image_id"],
+        )
 
     @pytest.mark.asyncio
     async def test_create_vm_invalid_flavor(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test creating VM with invalid flavor."""
         response = await client.post(
             "/api/v1/vms",
-            headers=api_key_header,
             json={
                 "name": "test-vm",
                 "flavor_id": "invalid-flavor",
@@ -128,12 +144,10 @@ class TestVMEndpoints:
     async def test_create_vm_invalid_image(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test creating VM with invalid image."""
         response = await client.post(
             "/api/v1/vms",
-            headers=api_key_header,
             json={
                 "name": "test-vm",
                 "flavor_id": "m1.small",
@@ -143,94 +157,125 @@ class TestVMEndpoints:
         assert response.status_code == 404
 
     @pytest.mark.asyncio
-    async def test_get_vm(
+    async def test_create_vm_openstack_failure(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
         sample_vm_data: dict[str, Any],
+    ) -> None:
+        """Test that a failed OpenStack create leaves the VM in ERROR."""
+
+        class FailingClient(MockOpenStackClient):
+            async def create_server(self, **kwargs: Any) -> dict[str, Any]:
+                raise OpenStackException("Quota exceeded")
+
+        previous = app.dependency_overrides[get_client]
+        app.dependency_overrides[get_client] = FailingClient
+        try:
+            response = await client.post(
+                "/api/v1/vms",
+                json=sample_vm_data,
+            )
+        finally:
+            app.dependency_overrides[get_client] = previous
+        assert response.status_code == 502
+
+        list_response = await client.get("/api/v1/vms")
+        items = list_response.json()["items"]
+        assert len(items) == 1
+        assert items[0]["state"] == "ERROR"
+        assert items[0]["state_description"] == "Quota exceeded"
+
+    @pytest.mark.asyncio
+    async def test_create_vm_cancelled(
+        self,
+        client: AsyncClient,
+        test_db: async_sessionmaker[AsyncSession],
+        sample_vm_data: dict[str, Any],
+    ) -> None:
+        """Test that a create cancelled mid-call doesn't strand a BUILDING VM."""
+
+        class HangingClient(MockOpenStackClient):
+            async def create_server(self, **kwargs: Any) -> dict[str, Any]:
+                raise asyncio.CancelledError
+
+        async with test_db() as session:
+            service = VMService(session, HangingClient())
+            with pytest.raises(asyncio.CancelledError):
+                await service.create_vm(VMCreate(**sample_vm_data))
+
+        list_response = await client.get("/api/v1/vms")
+        items = list_response.json()["items"]
+        assert len(items) == 1
+        assert items[0]["state"] == "ERROR"
+        assert items[0]["state_description"] == "CancelledError"
+
+    @pytest.mark.asyncio
+    async def test_get_vm(
+        self,
+        client: AsyncClient,
+        created_vm: dict[str, Any],
     ) -> None:
         """Test getting VM details."""
-        # Create VM first
-        create_response = await client.post(
-            "/api/v1/vms",
-            headers=api_key_header,
-            json=sample_vm_data,
-        )
-        vm_uuid = create_response.json()["uuid"]
+        vm_uuid = created_vm["uuid"]
 
         # Get VM
-        response = await client.get(
-            f"/api/v1/vms/{vm_uuid}",
-            headers=api_key_header,
-        )
+        response = await client.get(f"/api/v1/vms/{vm_uuid}")
         assert response.status_code == 200
 
         data = response.json()
         assert data["uuid"] == vm_uuid
-        assert data["name"] == sample_vm_data["name"]
+        assert_vm_shape(
+            data,
+            name=created_vm["name"],
+            flavor_id=created_vm["flavor_id"],
+            image_id=created_vm["image_id"],
+        )
 
     @pytest.mark.asyncio
     async def test_get_vm_not_found(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test getting non-existent VM."""
-        response = await client.get(
-            "/api/v1/vms/non-existent-uuid",
-            headers=api_key_header,
-        )
+        response = await client.get("/api/v1/vms/non-existent-uuid")
         assert response.status_code == 404
 
     @pytest.mark.asyncio
     async def test_update_vm(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
-        sample_vm_data: dict[str, Any],
+        created_vm: dict[str, Any],
     ) -> None:
         """Test updating VM details."""
-        # Create VM first
-        create_response = await client.post(
-            "/api/v1/vms",
-            headers=api_key_header,
-            json=sample_vm_data,
-        )
-        vm_uuid = create_response.json()["uuid"]
+        vm_uuid = created_vm["uuid"]
 
         # Update VM
         response = await client.patch(
             f"/api/v1/vms/{vm_uuid}",
-            headers=api_key_header,
             json={"name": "updated-vm-name", "description": "Updated description"},
         )
         assert response.status_code == 200
 
         data = response.json()
-        assert data["name"] == "updated-vm-name"
+        assert_vm_shape(
+            data,
+            name="updated-vm-name",
+            flavor_id=created_vm["flavor_id"],
+            image_id=created_vm["image_id"],
+        )
         assert data["description"] == "Updated description"
 
     @pytest.mark.asyncio
     async def test_delete_vm(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
-        sample_vm_data: dict[str, Any],
+        created_vm: dict[str, Any],
     ) -> None:
         """Test deleting a VM."""
-        # Create VM first
-        create_response = await client.post(
-            "/api/v1/vms",
-            headers=api_key_header,
-            json=sample_vm_data,
-        )
-        vm_uuid = create_response.json()["uuid"]
+        vm_uuid = created_vm["uuid"]
 
         # Delete VM
-        response = await client.delete(
-            f"/api/v1/vms/{vm_uuid}",
-            headers=api_key_header,
-        )
+        response = await client.delete(f"/api/v1/vms/{vm_uuid}")
         assert response.status_code == 200
 
         data = response.json()
@@ -239,33 +284,20 @@ class TestVMEndpoints:
         assert data["current_state"] == "DELETED"
 
         # Verify VM is deleted
-        get_response = await client.get(
-            f"/api/v1/vms/{vm_uuid}",
-            headers=api_key_header,
-        )
+        get_response = await client.get(f"/api/v1/vms/{vm_uuid}")
         assert get_response.status_code == 404
 
     @pytest.mark.asyncio
     async def test_stop_vm(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
-        sample_vm_data: dict[str, Any],
+        created_vm: dict[str, Any],
     ) -> None:
         """Test stopping a running VM."""
-        # Create VM first (starts as ACTIVE)
-        create_response = await client.post(
-            "/api/v1/vms",
-            headers=api_key_header,
-            json=sample_vm_data,
-        )
-        vm_uuid = create_response.json()["uuid"]
+        vm_uuid = created_vm["uuid"]
 
         # Stop VM
-        response = await client.post(
-            f"/api/v1/vms/{vm_uuid}/stop",
-            headers=api_key_header,
-        )
+        response = await client.post(f"/api/v1/vms/{vm_uuid}/stop")
         assert response.status_code == 200
 
         data = response.json()
@@ -277,28 +309,11 @@ class TestVMEndpoints:
     async def test_start_vm(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
-        sample_vm_data: dict[str, Any],
+        stopped_vm_uuid: str,
     ) -> None:
         """Test starting a stopped VM."""
-        # Create and stop VM
-        create_response = await client.post(
-            "/api/v1/vms",
-            headers=api_key_header,
-            json=sample_vm_data,
-        )
-        vm_uuid = create_response.json()["uuid"]
-
-        await client.post(
-            f"/api/v1/vms/{vm_uuid}/stop",
-            headers=api_key_header,
-        )
-
         # Start VM
-        response = await client.post(
-            f"/api/v1/vms/{vm_uuid}/start",
-            headers=api_key_header,
-        )
+        response = await client.post(f"/api/v1/vms/{stopped_vm_uuid}/start")
         assert response.status_code == 200
 
         data = response.json()
@@ -310,22 +325,14 @@ class TestVMEndpoints:
     async def test_reboot_vm(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
-        sample_vm_data: dict[str, Any],
+        created_vm: dict[str, Any],
     ) -> None:
         """Test rebooting a running VM."""
-        # Create VM first
-        create_response = await client.post(
-            "/api/v1/vms",
-            headers=api_key_header,
-            json=sample_vm_data,
-        )
-        vm_uuid = create_response.json()["uuid"]
+        vm_uuid = created_vm["uuid"]
 
         # Reboot VM (soft)
         response = await client.post(
             f"/api/v1/vms/{vm_uuid}/reboot",
-            headers=api_key_header,
             json={"reboot_type": "SOFT"},
         )
         assert response.status_code == 200
@@ -335,18 +342,136 @@ class TestVMEndpoints:
         assert data["status"] == "success"
         assert data["current_state"] == "ACTIVE"
 
+    @pytest.mark.asyncio
+    async def test_bulk_stop_vms(
+        self,
+        client: AsyncClient,
+        sample_vm_data: dict[str, Any],
+    ) -> None:
+        """Test stopping several VMs in one request."""
+        vm_uuids = []
+        for i in range(2):
+            create_response = await client.post(
+                "/api/v1/vms",
+                json={**sample_vm_data, "name": f"bulk-vm-{i}"},
+            )
+            vm_uuids.append(create_response.json()["uuid"])
+
+        response = await client.post(
+            "/api/v1/vms/actions/bulk",
+            json={"action": "stop", "vm_uuids": [*vm_uuids, "non-existent-uuid"]},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["action"] == "stop"
+        assert data["succeeded"] == 2
+        assert data["failed"] == 1
+        assert [r["status"] for r in data["results"]] == [
+            "success",
+            "success",
+            "failed",
+        ]
+
+        get_response = await client.get(f"/api/v1/vms/{vm_uuids[0]}")
+        assert get_response.json()["state"] == "SHUTOFF"
+
+    @pytest.mark.asyncio
+    async def test_bulk_sync_vm_states(
+        self,
+        client: AsyncClient,
+        sample_vm_data: dict[str, Any],
+    ) -> None:
+        """Test syncing several VMs from OpenStack in one request."""
+        vm_uuids = []
+        for i in range(2):
+            create_response = await client.post(
+                "/api/v1/vms",
+                json={**sample_vm_data, "name": f"sync-vm-{i}"},
+            )
+            vm_uuids.append(create_response.json()["uuid"])
+
+        class ShutOffClient(MockOpenStackClient):
+            async def get_server(self, server_id: str) -> dict[str, Any]:
+                return {"id": server_id, "status": "SHUTOFF", "ip_address": "10.9.9.9"}
+
+        previous = app.dependency_overrides[get_client]
+        app.dependency_overrides[get_client] = ShutOffClient
+        try:
+            response = await client.post(
+                "/api/v1/vms/actions/sync",
+                json={"vm_uuids": [*vm_uuids, "non-existent-uuid"]},
+            )
+        finally:
+            app.dependency_overrides[get_client] = previous
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["action"] == "sync"
+        assert data["succeeded"] == 2
+        assert data["failed"] == 1
+        assert data["results"][0]["previous_state"] == "ACTIVE"
+        assert data["results"][0]["current_state"] == "SHUTOFF"
+
+        # The new state and IP were persisted, not just reported
+        for vm_uuid in vm_uuids:
+            vm = (await client.get(f"/api/v1/vms/{vm_uuid}")).json()
+            assert vm["state"] == "SHUTOFF"
+            assert vm["ip_address"] == "10.9.9.9"
+
+    @pytest.mark.asyncio
+    async def test_bulk_sync_vm_states_cancelled_lookup(
+        self,
+        client: AsyncClient,
+        sample_vm_data: dict[str, Any],
+    ) -> None:
+        """Test that a cancelled lookup fails only that VM's sync."""
+        vm_uuids = []
+        openstack_ids = []
+        for i in range(2):
+            vm = (
+                await client.post(
+                    "/api/v1/vms",
+                    json={**sample_vm_data, "name": f"sync-vm-{i}"},
+                )
+            ).json()
+            vm_uuids.append(vm["uuid"])
+            openstack_ids.append(vm["openstack_id"])
+
+        class CancellingClient(MockOpenStackClient):
+            async def get_server(self, server_id: str) -> dict[str, Any]:
+                if server_id == openstack_ids[0]:
+                    raise asyncio.CancelledError
+                return {"id": server_id, "status": "SHUTOFF"}
+
+        previous = app.dependency_overrides[get_client]
+        app.dependency_overrides[get_client] = CancellingClient
+        try:
+            response = await client.post(
+                "/api/v1/vms/actions/sync",
+                json={"vm_uuids": vm_uuids},
+            )
+        finally:
+            app.dependency_overrides[get_client] = previous
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["succeeded"] == 1
+        assert data["failed"] == 1
+        assert data["results"][0]["status"] == "failed"
+        assert data["results"][0]["current_state"] == "ACTIVE"
+        assert data["results"][1]["current_state"] == "SHUTOFF"
+
     @pytest.mark.asyncio
     async def test_list_vms_pagination(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test VM list pagination."""
         # Create multiple VMs
         for i in range(5):
             await client.post(
                 "/api/v1/vms",
-                headers=api_key_header,
                 json={
                     "name": f"test-vm-{i}",
                     "flavor_id": "m1.small",
@@ -357,7 +482,6 @@ class TestVMEndpoints:
         # Test pagination
         response = await client.get(
             "/api/v1/vms",
-            headers=api_key_header,
             params={"page": 1, "page_size": 2},
         )
         assert response.status_code == 200
@@ -368,6 +492,41 @@ class TestVMEndpoints:
         assert data["page"] == 1
         assert data["pages"] == 3
 
+        # Past the last page the total is still reported
+        response = await client.get(
+            "/api/v1/vms",
+            params={"page": 4, "page_size": 2},
+        )
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 5
+
+    @pytest.mark.asyncio
+    async def test_list_vms_name_filter(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """Test that the name filter matches a literal substring."""
+        for name in ("web-1", "db_1"):
+            await client.post(
+                "/api/v1/vms",
+                json={
+                    "name": name,
+                    "flavor_id": "m1.small",
+                    "image_id": "ubuntu-22.04",
+                },
+            )
+
+        response = await client.get(
+            "/api/v1/vms",
+            params={"name": "_"},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["name"] == "db_1"
+
 
 class TestFlavorEndpoints:
     """Tests for flavor endpoints."""
@@ -376,10 +535,9 @@ class TestFlavorEndpoints:
     async def test_list_flavors(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test listing available flavors."""
-        response = await client.get("/api/v1/flavors", headers=api_key_header)
+        response = await client.get("/api/v1/flavors")
         assert response.status_code == 200
 
         data = response.json()
@@ -399,13 +557,9 @@ class TestFlavorEndpoints:
     async def test_get_flavor(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test getting a specific flavor."""
-        response = await client.get(
-            "/api/v1/flavors/m1.small",
-            headers=api_key_header,
-        )
+        response = await client.get("/api/v1/flavors/m1.small")
         assert response.status_code == 200
 
         data = response.json()
@@ -413,17 +567,30 @@ class TestFlavorEndpoints:
         assert "vcpus" in data
         assert "memory_mb" in data
 
+    @pytest.mark.asyncio
+    async def test_get_flavor_not_modified(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """Test a matching If-None-Match returns 304 without a body."""
+        response = await client.get("/api/v1/flavors/m1.small")
+        etag = response.headers["etag"]
+
+        cached_response = await client.get(
+            "/api/v1/flavors/m1.small",
+            headers={"If-None-Match": f"W/{etag}"},
+        )
+        assert cached_response.status_code == 304
+        assert cached_response.headers["etag"] == etag
+        assert cached_response.content == b""
+
     @pytest.mark.asyncio
     async def test_get_flavor_not_found(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test getting a non-existent flavor."""
-        response = await client.get(
-            "/api/v1/flavors/non-existent",
-            headers=api_key_header,
-        )
+        response = await client.get("/api/v1/flavors/non-existent")
         assert response.status_code == 404
 
 
@@ -434,10 +601,9 @@ class TestImageEndpoints:
     async def test_list_images(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test listing available images."""
-        response = await client.get("/api/v1/images", headers=api_key_header)
+        response = await client.get("/api/v1/images")
         assert response.status_code == 200
 
         data = response.json()
@@ -455,13 +621,9 @@ class TestImageEndpoints:
     async def test_get_image(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test getting a specific image."""
-        response = await client.get(
-            "/api/v1/images/ubuntu-22.04",
-            headers=api_key_header,
-        )
+        response = await client.get("/api/v1/images/ubuntu-22.04")
         assert response.status_code == 200
 
         data = response.json()
@@ -473,11 +635,7 @@ class TestImageEndpoints:
     async def test_get_image_not_found(
         self,
         client: AsyncClient,
-        api_key_header: dict[str, str],
     ) -> None:
         """Test getting a non-existent image."""
-        response = await client.get(
-            "/api/v1/images/non-existent",
-            headers=api_key_header,
-        )
+        response = await client.get("/api/v1/images/non-existent")
         assert response.status_code == 404
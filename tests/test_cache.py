@@ -0,0 +1,93 @@
+"""Tests for the in-process caching helpers."""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import SingleFlight, TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    @pytest.mark.asyncio
+    async def test_caches_value(self) -> None:
+        """Test that a cached value is returned without calling the factory."""
+        cache: TTLCache[int] = TTLCache(ttl=60)
+        calls = 0
+
+        async def factory() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get_or_set("key", factory) == 1
+        assert await cache.get_or_set("key", factory) == 1
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_value_is_reloaded(self) -> None:
+        """Test that entries older than the TTL are refreshed."""
+        cache: TTLCache[int] = TTLCache(ttl=0)
+        calls = 0
+
+        async def factory() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get_or_set("key", factory) == 1
+        assert await cache.get_or_set("key", factory) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self) -> None:
+        """Test that concurrent misses for a key coalesce into one call."""
+        cache: TTLCache[str] = TTLCache(ttl=60)
+        calls = 0
+
+        async def factory() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *[cache.get_or_set("key", factory) for _ in range(5)]
+        )
+        assert results == ["value"] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        """Test that a failing factory is retried on the next call."""
+        cache: TTLCache[str] = TTLCache(ttl=60)
+
+        async def failing() -> str:
+            raise RuntimeError("upstream down")
+
+        async def working() -> str:
+            return "value"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_set("key", failing)
+        assert await cache.get_or_set("key", working) == "value"
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_calls_only(self) -> None:
+        """Test that concurrent calls share one result but nothing is kept."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def factory() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*[flight.do("key", factory) for _ in range(5)])
+        assert results == [1] * 5
+        assert await flight.do("key", factory) == 2
@@ -0,0 +1,42 @@
+"""Tests for the maintenance command-line entry points."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestInitDb:
+    """Tests for the init-db command."""
+
+    def test_init_db_creates_schema(self, tmp_path: Path) -> None:
+        """Test that init-db creates the vms table and its indexes.
+
+        Runs in a fresh interpreter so nothing imported by the test suite
+        registers the models on its behalf.
+        """
+        db_path = tmp_path / "init.db"
+        env = {**os.environ, "DATABASE_URL": f"sqlite+aiosqlite:///{db_path}"}
+
+        result = subprocess.run(
+            [sys.executable, "-c", "from app.cli import main; main(['init-db'])"],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert "Database tables created/verified" in result.stdout
+
+        with sqlite3.connect(db_path) as conn:
+            objects = dict(
+                conn.execute(
+                    "SELECT name, type FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'"
+                )
+            )
+        assert objects.get("vms") == "table"
+        assert objects.get("ix_vms_active_created") == "index"
+        assert objects.get("ix_vms_uuid") == "index"